@@ -6,18 +6,24 @@ for user interaction with the bot, including source management, subscriptions,
 and administrative functions.
 """
 
+import asyncio
+import re
 from aiogram import Router, F, Dispatcher
 from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+from cachetools import TTLCache
 from datetime import datetime
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import case, delete, exists, func, select, true
+from sqlalchemy.exc import IntegrityError
+from urllib.parse import urlparse
 
-from models.database import Session, Source, User, Subscription
+from models.database import AsyncSession, Source, User, Subscription, upsert_insert
+from models.schemas import DEFAULT_EMOJI, SOURCE_EMOJI
 from services.scraper import ScraperService, ScraperError
 from bot.keyboards import (
+    SourceCallback,
     main_menu_markup,
     sources_menu_markup,
     source_info_markup,
@@ -32,6 +38,44 @@ from utils.logger import get_logger
 logger = get_logger("handlers")
 router = Router()
 
+# Static replies are built once at import and shared by every request
+HELP_TEXT = (
+    "🔧 **News Feed Bot Help**\n\n"
+    "**Available Commands:**\n"
+    "/start - Start the bot and show main menu\n"
+    "/help - Show this help message\n"
+    "/menu - Show the main menu\n"
+    "/sources - List all available sources\n"
+    "/subscriptions - Manage your subscriptions\n\n"
+    "**For Admins:**\n"
+    "/add_source - Add a new content source\n"
+    "/admin - Admin panel\n"
+    "/stats - Bot statistics\n\n"
+    "**Supported Source Types:**\n"
+    "📰 RSS/Atom feeds\n"
+    "🌐 Generic websites\n"
+    "🐦 Twitter (via RSS alternatives)\n"
+    "📺 YouTube channels\n"
+    "🔴 Reddit subreddits\n\n"
+    "**Note:** Facebook and Instagram require official API access."
+)
+
+STATS_TEMPLATE = (
+    "📊 **Bot Statistics**\n\n"
+    "👥 **Users:** {active_users}/{total_users} active\n"
+    "📰 **Sources:** {active_sources}/{total_sources} active\n"
+    "🔔 **Subscriptions:** {active_subscriptions}/{total_subscriptions} active\n\n"
+    "**Source Types:**\n"
+)
+
+# Accepted shape for new source URLs and hosts that are never scraped
+URL_RE = re.compile(r"^https?://[a-z0-9.-]+(?::\d+)?(?:[/?#]\S*)?$", re.IGNORECASE)
+BLOCKED_HOSTS = frozenset({"localhost", "127.0.0.1", "0.0.0.0", "::1"})
+
+# Short-lived cache of the rendered active sources list (text and keyboard);
+# cleared when sources change
+_sources_cache = TTLCache(maxsize=1, ttl=30)
+
 
 class AdminStates(StatesGroup):
     """States for admin operations."""
@@ -51,75 +95,62 @@ async def cmd_start(message: Message):
     Registers new users and displays the welcome message with main menu.
     """
     try:
-        with Session() as session:
-            user = session.query(User).filter(User.id == message.from_user.id).first()
+        user = message.from_user
+        now = datetime.utcnow()
+        
+        # Register or refresh the user in one round-trip; created_at only
+        # equals `now` when the row was actually inserted
+        stmt = upsert_insert(User).values(
+            id=user.id,
+            username=user.username,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            language_code=user.language_code or 'en',
+            created_at=now,
+            last_active=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.id],
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "last_active": stmt.excluded.last_active
+            }
+        ).returning(User.created_at)
+        
+        async with AsyncSession() as session:
+            created_at = (await session.execute(stmt)).scalar_one()
+            await session.commit()
+        
+        if created_at == now:
+            logger.info(f"New user registered: {user.id} (@{user.username})")
             
-            if not user:
-                # Create new user
-                user = User(
-                    id=message.from_user.id,
-                    username=message.from_user.username,
-                    first_name=message.from_user.first_name,
-                    last_name=message.from_user.last_name,
-                    language_code=message.from_user.language_code or 'en'
-                )
-                session.add(user)
-                session.commit()
-                logger.info(f"New user registered: {user.id} (@{user.username})")
-                
-                welcome_text = (
-                    "🎉 Welcome to the News Feed Bot!\n\n"
-                    "I can help you stay updated with your favorite content sources:\n"
-                    "• RSS feeds\n"
-                    "• Websites\n"
-                    "• Social media (with limitations)\n\n"
-                    "Use the menu below to get started!"
-                )
-            else:
-                # Update user info and last active time
-                user.username = message.from_user.username
-                user.first_name = message.from_user.first_name
-                user.last_name = message.from_user.last_name
-                user.last_active = datetime.utcnow()
-                session.commit()
-                
-                welcome_text = (
-                    f"👋 Welcome back, {user.first_name or user.username or 'User'}!\n\n"
-                    "Ready to catch up on your news feeds?"
-                )
+            welcome_text = (
+                "🎉 Welcome to the News Feed Bot!\n\n"
+                "I can help you stay updated with your favorite content sources:\n"
+                "• RSS feeds\n"
+                "• Websites\n"
+                "• Social media (with limitations)\n\n"
+                "Use the menu below to get started!"
+            )
+        else:
+            welcome_text = (
+                f"👋 Welcome back, {user.first_name or user.username or 'User'}!\n\n"
+                "Ready to catch up on your news feeds?"
+            )
         
         await message.answer(welcome_text, reply_markup=main_menu_markup())
         
     except Exception as e:
-        logger.error(f"Error in start command for user {message.from_user.id}: {e}")
+        logger.error(f"Error in start command for user {message.from_user.id}: {e}", exc_info=True)
         await message.answer("❌ Sorry, something went wrong. Please try again later.")
 
 
 @router.message(Command("help"))
 async def cmd_help(message: Message):
     """Handle the /help command."""
-    help_text = (
-        "🔧 **News Feed Bot Help**\n\n"
-        "**Available Commands:**\n"
-        "/start - Start the bot and show main menu\n"
-        "/help - Show this help message\n"
-        "/menu - Show the main menu\n"
-        "/sources - List all available sources\n"
-        "/subscriptions - Manage your subscriptions\n\n"
-        "**For Admins:**\n"
-        "/add_source - Add a new content source\n"
-        "/admin - Admin panel\n"
-        "/stats - Bot statistics\n\n"
-        "**Supported Source Types:**\n"
-        "📰 RSS/Atom feeds\n"
-        "🌐 Generic websites\n"
-        "🐦 Twitter (via RSS alternatives)\n"
-        "📺 YouTube channels\n"
-        "🔴 Reddit subreddits\n\n"
-        "**Note:** Facebook and Instagram require official API access."
-    )
-    
-    await message.answer(help_text, parse_mode="Markdown", reply_markup=help_markup())
+    await message.answer(HELP_TEXT, parse_mode="Markdown", reply_markup=help_markup())
 
 
 @router.message(Command("menu"))
@@ -170,11 +201,12 @@ async def cmd_add_source(message: Message, state: FSMContext):
 
 
 @router.message(F.text, AdminStates.waiting_for_source)
-async def process_new_source(message: Message, state: FSMContext):
+async def process_new_source(message: Message, state: FSMContext, scraper: ScraperService):
     """
     Process the URL for a new source.
     
     Validates the URL, detects the source type, and adds it to the database.
+    The shared scraper is injected from the dispatcher's workflow data.
     """
     if message.text.lower() == '/cancel':
         await state.clear()
@@ -183,44 +215,51 @@ async def process_new_source(message: Message, state: FSMContext):
     
     url = message.text.strip()
     
-    if not url.startswith(('http://', 'https://')):
+    # Cheap shape and host checks before any network or database work
+    host = urlparse(url).hostname if URL_RE.match(url) else None
+    if not host or host in BLOCKED_HOSTS:
         await message.answer(
             "❌ Invalid URL. Please provide a complete URL starting with http:// or https://\n"
             "Send /cancel to abort."
         )
         return
     
+    if not await _host_resolves(host):
+        await message.answer(
+            f"❌ Could not resolve host {host}. Please check the URL.\n"
+            "Send /cancel to abort."
+        )
+        return
+    
     try:
         # Show processing message
         processing_msg = await message.answer("🔍 Analyzing source... This may take a moment.")
         
         # Detect source type and validate
-        async with ScraperService() as scraper:
-            source_type = await scraper.detect_source_type(url)
-            
-            # Try to scrape a sample to validate
-            sample_items = await scraper.scrape_source(url, source_type)
-        
-        with Session() as session:
-            # Check if source already exists
-            existing_source = session.query(Source).filter(Source.url == url).first()
-            if existing_source:
-                await processing_msg.edit_text("❌ This source is already configured!")
-                await state.clear()
-                return
-            
-            # Create new source
-            source = Source(
-                url=url,
-                type=source_type,
-                added_by=message.from_user.id,
-                title=f"{source_type.upper()} Source"
-            )
-            session.add(source)
-            session.commit()
-            
-            # Get the source ID for the response
-            source_id = source.id
+        source_type = await scraper.detect_source_type(url)
+        
+        # Try to scrape a sample to validate
+        sample_items = await scraper.scrape_source(url, source_type)
+        
+        async with AsyncSession() as session:
+            # Insert unless the URL is already configured; no row comes back
+            # when the unique constraint on url rejects the insert
+            source_id = (await session.execute(
+                upsert_insert(Source).values(
+                    url=url,
+                    type=source_type,
+                    added_by=message.from_user.id,
+                    title=f"{source_type.upper()} Source"
+                ).on_conflict_do_nothing(index_elements=[Source.url]).returning(Source.id)
+            )).scalar_one_or_none()
+            await session.commit()
+        
+        if source_id is None:
+            await processing_msg.edit_text("❌ This source is already configured!")
+            await state.clear()
+            return
+        
+        _sources_cache.clear()
         
         await state.clear()
         
@@ -241,7 +280,7 @@ async def process_new_source(message: Message, state: FSMContext):
         logger.error(f"Scraper error while adding source {url}: {e}")
     except Exception as e:
         await processing_msg.edit_text(f"❌ Unexpected error: {str(e)}")
-        logger.error(f"Error adding source {url}: {e}")
+        logger.error(f"Error adding source {url}: {e}", exc_info=True)
 
 
 @router.message(Command("admin"))
@@ -258,34 +297,47 @@ async def cmd_admin(message: Message):
 async def cmd_stats(message: Message):
     """Handle the /stats command to show bot statistics."""
     try:
-        with Session() as session:
-            # Gather statistics
-            total_users = session.query(User).count()
-            active_users = session.query(User).filter(User.is_active == True).count()
-            total_sources = session.query(Source).count()
-            active_sources = session.query(Source).filter(Source.is_active == True).count()
-            total_subscriptions = session.query(Subscription).count()
-            active_subscriptions = session.query(Subscription).filter(Subscription.is_active == True).count()
+        async with AsyncSession() as session:
+            # Gather all totals in a single round-trip
+            users = _total_and_active(User)
+            sources = _total_and_active(Source)
+            subscriptions = _total_and_active(Subscription)
+            (
+                total_users, active_users,
+                total_sources, active_sources,
+                total_subscriptions, active_subscriptions
+            ) = (await session.execute(
+                select(
+                    users.c.total, users.c.active,
+                    sources.c.total, sources.c.active,
+                    subscriptions.c.total, subscriptions.c.active
+                ).select_from(
+                    users.join(sources, true()).join(subscriptions, true())
+                )
+            )).one()
             
             # Source type breakdown
-            source_types = session.query(Source.type, func.count(Source.id)).group_by(Source.type).all()
+            source_types = (await session.execute(
+                select(Source.type, func.count(Source.id)).group_by(Source.type)
+            )).all()
             
-        stats_text = (
-            f"📊 **Bot Statistics**\n\n"
-            f"👥 **Users:** {active_users}/{total_users} active\n"
-            f"📰 **Sources:** {active_sources}/{total_sources} active\n"
-            f"🔔 **Subscriptions:** {active_subscriptions}/{total_subscriptions} active\n\n"
-            f"**Source Types:**\n"
+        parts = [STATS_TEMPLATE.format(
+            active_users=active_users,
+            total_users=total_users,
+            active_sources=active_sources,
+            total_sources=total_sources,
+            active_subscriptions=active_subscriptions,
+            total_subscriptions=total_subscriptions
+        )]
+        parts.extend(
+            f"{SOURCE_EMOJI.get(source_type, DEFAULT_EMOJI)} {source_type.upper()}: {count}\n"
+            for source_type, count in source_types
         )
         
-        for source_type, count in source_types:
-            emoji = {"rss": "📰", "twitter": "🐦", "facebook": "📘", "instagram": "📸", "website": "🌐", "youtube": "📺", "reddit": "🔴"}.get(source_type, "📄")
-            stats_text += f"{emoji} {source_type.upper()}: {count}\n"
-        
-        await message.answer(stats_text, parse_mode="Markdown")
+        await message.answer("".join(parts), parse_mode="Markdown")
         
     except Exception as e:
-        logger.error(f"Error generating stats: {e}")
+        logger.error(f"Error generating stats: {e}", exc_info=True)
         await message.answer("❌ Error generating statistics.")
 
 
@@ -314,29 +366,33 @@ async def callback_my_subscriptions(callback: CallbackQuery):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("source_info_"))
-async def callback_source_info(callback: CallbackQuery):
+@router.callback_query(SourceCallback.filter(F.action == "info"))
+async def callback_source_info(callback: CallbackQuery, callback_data: SourceCallback):
     """Handle source info callback."""
     try:
-        source_id = int(callback.data.split("_")[-1])
+        source_id = callback_data.source_id
+        
+        # Load the source together with the user's subscription flag
+        is_subscribed_expr = exists().where(
+            Subscription.source_id == Source.id,
+            Subscription.user_id == callback.from_user.id,
+            Subscription.is_active == True
+        ).label("is_subscribed")
+        
+        async with AsyncSession() as session:
+            row = (await session.execute(
+                select(Source, is_subscribed_expr).where(Source.id == source_id)
+            )).one_or_none()
+        
+        if not row:
+            await callback.answer("❌ Source not found!")
+            return
+        
+        source, is_subscribed = row
+        
+        # Check if user is admin for delete button
+        is_admin = callback.from_user.id in config.ADMIN_IDS
         
-        with Session() as session:
-            source = session.query(Source).filter(Source.id == source_id).first()
-            if not source:
-                await callback.answer("❌ Source not found!")
-                return
-            
-            # Check if user is subscribed
-            subscription = session.query(Subscription).filter(
-                Subscription.user_id == callback.from_user.id,
-                Subscription.source_id == source_id
-            ).first()
-            
-            is_subscribed = subscription is not None and subscription.is_active
-            
-            # Check if user is admin for delete button
-            is_admin = callback.from_user.id in config.ADMIN_IDS
-            
         source_text = (
             f"📰 **Source Information**\n\n"
             f"🔗 **URL:** {source.url}\n"
@@ -352,104 +408,97 @@ async def callback_source_info(callback: CallbackQuery):
         if source.last_updated:
             source_text += f"🆕 **Last Updated:** {source.last_updated.strftime('%Y-%m-%d %H:%M UTC')}\n"
         
-        keyboard = source_info_markup(source_id, is_subscribed)
-        
-        # Remove delete button for non-admins
-        if not is_admin and len(keyboard.inline_keyboard) > 1:
-            keyboard.inline_keyboard.pop(1)  # Remove delete button
+        keyboard = _source_info_keyboard(source_id, is_subscribed, is_admin)
         
         await callback.message.edit_text(source_text, parse_mode="Markdown", reply_markup=keyboard)
         await callback.answer()
         
     except Exception as e:
-        logger.error(f"Error showing source info: {e}")
+        logger.error(f"Error showing source info: {e}", exc_info=True)
         await callback.answer("❌ Error loading source information.")
 
 
-@router.callback_query(F.data.startswith("subscribe_"))
-async def callback_subscribe(callback: CallbackQuery):
+@router.callback_query(SourceCallback.filter(F.action == "subscribe"))
+async def callback_subscribe(callback: CallbackQuery, callback_data: SourceCallback):
     """Handle subscribe callback."""
     try:
-        source_id = int(callback.data.split("_")[-1])
-        
-        with Session() as session:
-            # Check if source exists
-            source = session.query(Source).filter(Source.id == source_id).first()
-            if not source:
+        source_id = callback_data.source_id
+        
+        async with AsyncSession() as session:
+            # Create the subscription or reactivate an existing one
+            stmt = upsert_insert(Subscription).values(
+                user_id=callback.from_user.id,
+                source_id=source_id,
+                is_active=True,
+                notification_enabled=True
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Subscription.user_id, Subscription.source_id],
+                set_={"is_active": True, "notification_enabled": True}
+            )
+            try:
+                await session.execute(stmt)
+                await session.commit()
+            except IntegrityError:
+                # Foreign key violation: the source no longer exists
                 await callback.answer("❌ Source not found!")
                 return
-            
-            # Check for existing subscription
-            existing = session.query(Subscription).filter(
-                Subscription.user_id == callback.from_user.id,
-                Subscription.source_id == source_id
-            ).first()
-            
-            if existing:
-                if existing.is_active:
-                    await callback.answer("ℹ️ You're already subscribed to this source!")
-                    return
-                else:
-                    # Reactivate subscription
-                    existing.is_active = True
-                    existing.notification_enabled = True
-            else:
-                # Create new subscription
-                subscription = Subscription(
-                    user_id=callback.from_user.id,
-                    source_id=source_id
-                )
-                session.add(subscription)
-            
-            session.commit()
         
         await callback.answer("✅ Successfully subscribed!")
         
-        # Refresh the source info display
-        await callback_source_info(callback)
+        # Only the subscribe/unsubscribe button changed, so swap the keyboard
+        is_admin = callback.from_user.id in config.ADMIN_IDS
+        await callback.message.edit_reply_markup(
+            reply_markup=_source_info_keyboard(source_id, True, is_admin)
+        )
         
     except Exception as e:
-        logger.error(f"Error subscribing to source: {e}")
+        logger.error(f"Error subscribing to source: {e}", exc_info=True)
         await callback.answer("❌ Error subscribing to source.")
 
 
-@router.callback_query(F.data.startswith("unsubscribe_"))
-async def callback_unsubscribe(callback: CallbackQuery):
+@router.callback_query(SourceCallback.filter(F.action == "unsubscribe"))
+async def callback_unsubscribe(callback: CallbackQuery, callback_data: SourceCallback):
     """Handle unsubscribe callback."""
     try:
-        source_id = int(callback.data.split("_")[-1])
+        source_id = callback_data.source_id
         
-        with Session() as session:
-            subscription = session.query(Subscription).filter(
-                Subscription.user_id == callback.from_user.id,
-                Subscription.source_id == source_id
-            ).first()
+        async with AsyncSession() as session:
+            subscription = (await session.execute(
+                select(Subscription).where(
+                    Subscription.user_id == callback.from_user.id,
+                    Subscription.source_id == source_id
+                )
+            )).scalar_one_or_none()
             
             if not subscription:
                 await callback.answer("ℹ️ You're not subscribed to this source!")
                 return
             
             subscription.is_active = False
-            session.commit()
+            await session.commit()
         
         await callback.answer("✅ Successfully unsubscribed!")
         
-        # Refresh the source info display
-        await callback_source_info(callback)
+        # Only the subscribe/unsubscribe button changed, so swap the keyboard
+        is_admin = callback.from_user.id in config.ADMIN_IDS
+        await callback.message.edit_reply_markup(
+            reply_markup=_source_info_keyboard(source_id, False, is_admin)
+        )
         
     except Exception as e:
-        logger.error(f"Error unsubscribing from source: {e}")
+        logger.error(f"Error unsubscribing from source: {e}", exc_info=True)
         await callback.answer("❌ Error unsubscribing from source.")
 
 
-@router.callback_query(F.data.startswith("delete_source_"))
-async def callback_delete_source(callback: CallbackQuery):
+@router.callback_query(SourceCallback.filter(F.action == "delete"))
+async def callback_delete_source(callback: CallbackQuery, callback_data: SourceCallback):
     """Handle delete source callback (admin only)."""
     if callback.from_user.id not in config.ADMIN_IDS:
         await callback.answer("❌ Access denied!")
         return
     
-    source_id = int(callback.data.split("_")[-1])
+    source_id = callback_data.source_id
     
     await callback.message.edit_reply_markup(
         reply_markup=confirm_source_deletion_markup(source_id)
@@ -457,51 +506,116 @@ async def callback_delete_source(callback: CallbackQuery):
     await callback.answer("⚠️ Confirm deletion")
 
 
-@router.callback_query(F.data.startswith("confirm_delete_"))
-async def callback_confirm_delete(callback: CallbackQuery):
+@router.callback_query(SourceCallback.filter(F.action == "confirm_delete"))
+async def callback_confirm_delete(callback: CallbackQuery, callback_data: SourceCallback):
     """Handle confirm delete callback (admin only)."""
     if callback.from_user.id not in config.ADMIN_IDS:
         await callback.answer("❌ Access denied!")
         return
     
     try:
-        source_id = int(callback.data.split("_")[-1])
-        
-        with Session() as session:
-            source = session.query(Source).filter(Source.id == source_id).first()
-            if source:
-                # Delete all subscriptions first
-                session.query(Subscription).filter(Subscription.source_id == source_id).delete()
-                # Delete the source
-                session.delete(source)
-                session.commit()
-                
-                await callback.message.edit_text("✅ Source deleted successfully!")
-                logger.info(f"Admin {callback.from_user.id} deleted source: {source.url}")
-            else:
-                await callback.message.edit_text("❌ Source not found!")
+        source_id = callback_data.source_id
+        
+        async with AsyncSession() as session:
+            # Subscriptions are removed by the ON DELETE CASCADE foreign key
+            deleted_url = (await session.execute(
+                delete(Source).where(Source.id == source_id).returning(Source.url)
+            )).scalar_one_or_none()
+            await session.commit()
+        
+        _sources_cache.clear()
+        
+        if deleted_url:
+            await callback.message.edit_text("✅ Source deleted successfully!")
+            logger.info(f"Admin {callback.from_user.id} deleted source: {deleted_url}")
+        else:
+            await callback.message.edit_text("❌ Source not found!")
         
         await callback.answer()
         
     except Exception as e:
-        logger.error(f"Error deleting source: {e}")
+        logger.error(f"Error deleting source: {e}", exc_info=True)
         await callback.message.edit_text("❌ Error deleting source!")
         await callback.answer()
 
 
 # Helper functions
+async def _host_resolves(host: str) -> bool:
+    """
+    Check that a hostname resolves before handing the URL to the scraper.
+    
+    Args:
+        host: Hostname taken from the submitted URL
+    
+    Returns:
+        True if DNS resolution succeeded, False otherwise
+    """
+    try:
+        await asyncio.get_running_loop().getaddrinfo(host, None)
+        return True
+    except OSError:
+        return False
+
+
+def _source_info_keyboard(source_id: int, is_subscribed: bool, is_admin: bool):
+    """
+    Build the source info keyboard for the requesting user.
+    
+    Args:
+        source_id: ID of the displayed source
+        is_subscribed: Whether the user is subscribed to the source
+        is_admin: Whether the user may delete the source
+    
+    Returns:
+        InlineKeyboardMarkup with the delete button removed for non-admins
+    """
+    keyboard = source_info_markup(source_id, is_subscribed)
+    
+    # Remove delete button for non-admins
+    if not is_admin and len(keyboard.inline_keyboard) > 1:
+        keyboard.inline_keyboard.pop(1)  # Remove delete button
+    
+    return keyboard
+
+
+def _total_and_active(model):
+    """
+    Build a one-row subquery counting all and active rows of a model.
+    
+    Args:
+        model: ORM model with ``id`` and ``is_active`` columns
+    
+    Returns:
+        Subquery exposing ``total`` and ``active`` columns
+    """
+    return select(
+        func.count(model.id).label("total"),
+        func.coalesce(func.sum(case((model.is_active == True, 1), else_=0)), 0).label("active")
+    ).subquery()
+
+
 async def _show_sources_list(message: Message, edit: bool = False):
     """Show the list of all sources."""
     try:
-        with Session() as session:
-            sources = session.query(Source).filter(Source.is_active == True).all()
+        cached = _sources_cache.get("active")
+        if cached is None:
+            async with AsyncSession() as session:
+                # Only the columns rendered by the keyboard are fetched
+                sources = (await session.execute(
+                    select(Source.id, Source.type, Source.url).where(Source.is_active == True)
+                )).all()
+            
+            # Build the button labels once per cache period, not per request
+            if not sources:
+                cached = ("📋 **Available Sources**\n\nNo sources configured yet.", main_menu_markup())
+            else:
+                cached = (
+                    f"📋 **Available Sources** ({len(sources)})\n\nSelect a source to view details and subscribe:",
+                    sources_menu_markup(sources)
+                )
+            _sources_cache["active"] = cached
         
-        if not sources:
-            text = "📋 **Available Sources**\n\nNo sources configured yet."
-            keyboard = main_menu_markup()
-        else:
-            text = f"📋 **Available Sources** ({len(sources)})\n\nSelect a source to view details and subscribe:"
-            keyboard = sources_menu_markup(sources)
+        text, keyboard = cached
         
         if edit:
             await message.edit_text(text, parse_mode="Markdown", reply_markup=keyboard)
@@ -509,7 +623,7 @@ async def _show_sources_list(message: Message, edit: bool = False):
             await message.answer(text, parse_mode="Markdown", reply_markup=keyboard)
             
     except Exception as e:
-        logger.error(f"Error showing sources list: {e}")
+        logger.error(f"Error showing sources list: {e}", exc_info=True)
         error_text = "❌ Error loading sources list."
         if edit:
             await message.edit_text(error_text)
@@ -520,14 +634,17 @@ async def _show_sources_list(message: Message, edit: bool = False):
 async def _show_user_subscriptions(message: Message, edit: bool = False):
     """Show the user's subscriptions."""
     try:
-        with Session() as session:
-            subscriptions = session.query(Subscription).join(Source).filter(
-                Subscription.user_id == message.from_user.id,
-                Subscription.is_active == True,
-                Source.is_active == True
-            ).all()
-            
-            user_sources = [sub.source for sub in subscriptions]
+        async with AsyncSession() as session:
+            # Select the sources directly so no relationship traversal is needed
+            user_sources = (await session.execute(
+                select(Source.id, Source.type, Source.url)
+                .join(Subscription, Subscription.source_id == Source.id)
+                .where(
+                    Subscription.user_id == message.from_user.id,
+                    Subscription.is_active == True,
+                    Source.is_active == True
+                )
+            )).all()
         
         if not user_sources:
             text = (
@@ -546,7 +663,7 @@ async def _show_user_subscriptions(message: Message, edit: bool = False):
             await message.answer(text, parse_mode="Markdown", reply_markup=keyboard)
             
     except Exception as e:
-        logger.error(f"Error showing user subscriptions: {e}")
+        logger.error(f"Error showing user subscriptions: {e}", exc_info=True)
         error_text = "❌ Error loading your subscriptions."
         if edit:
             await message.edit_text(error_text)
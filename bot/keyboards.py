@@ -5,15 +5,27 @@ This module contains all the inline keyboard configurations used throughout
 the bot for user interaction and navigation.
 """
 
+from functools import cache, lru_cache
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from typing import List, Optional
-from models.database import Source
+from typing import Sequence
 
+from models.schemas import DEFAULT_EMOJI, SOURCE_EMOJI
 
+
+class SourceCallback(CallbackData, prefix="src"):
+    """Structured callback data for actions on a single source."""
+    action: str
+    source_id: int
+
+
+@cache
 def main_menu_markup() -> InlineKeyboardMarkup:
     """
     Create the main menu inline keyboard markup.
     
+    The markup is built once and shared; callers must not mutate it.
+    
     Returns:
         InlineKeyboardMarkup with main menu options
     """
@@ -34,12 +46,12 @@ def main_menu_markup() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def sources_menu_markup(sources: List[Source]) -> InlineKeyboardMarkup:
+def sources_menu_markup(sources: Sequence) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for managing sources.
     
     Args:
-        sources: List of Source objects to display
+        sources: Source rows to display (anything exposing id, type and url)
     
     Returns:
         InlineKeyboardMarkup with source management options
@@ -48,18 +60,10 @@ def sources_menu_markup(sources: List[Source]) -> InlineKeyboardMarkup:
     
     # Add buttons for each source (max 10 to avoid message limits)
     for source in sources[:10]:
-        source_type_emoji = {
-            "rss": "📰",
-            "twitter": "🐦",
-            "facebook": "📘",
-            "instagram": "📸",
-            "website": "🌐"
-        }.get(source.type, "📄")
-        
         keyboard.append([
             InlineKeyboardButton(
-                text=f"{source_type_emoji} {source.type.upper()}: {source.url[:30]}...",
-                callback_data=f"source_info_{source.id}"
+                text=f"{SOURCE_EMOJI.get(source.type, DEFAULT_EMOJI)} {source.type.upper()}: {source.url[:30]}...",
+                callback_data=SourceCallback(action="info", source_id=source.id).pack()
             )
         ])
     
@@ -89,14 +93,14 @@ def source_info_markup(source_id: int, is_subscribed: bool = False) -> InlineKey
         keyboard.append([
             InlineKeyboardButton(
                 text="🔕 Unsubscribe",
-                callback_data=f"unsubscribe_{source_id}"
+                callback_data=SourceCallback(action="unsubscribe", source_id=source_id).pack()
             )
         ])
     else:
         keyboard.append([
             InlineKeyboardButton(
                 text="🔔 Subscribe",
-                callback_data=f"subscribe_{source_id}"
+                callback_data=SourceCallback(action="subscribe", source_id=source_id).pack()
             )
         ])
     
@@ -104,7 +108,7 @@ def source_info_markup(source_id: int, is_subscribed: bool = False) -> InlineKey
     keyboard.append([
         InlineKeyboardButton(
             text="🗑️ Delete Source",
-            callback_data=f"delete_source_{source_id}"
+            callback_data=SourceCallback(action="delete", source_id=source_id).pack()
         )
     ])
     
@@ -117,10 +121,13 @@ def source_info_markup(source_id: int, is_subscribed: bool = False) -> InlineKey
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1024)
 def confirm_source_deletion_markup(source_id: int) -> InlineKeyboardMarkup:
     """
     Create a confirmation keyboard for source deletion.
     
+    Markups are cached per source and shared; callers must not mutate them.
+    
     Args:
         source_id: ID of the source to delete
     
@@ -131,11 +138,11 @@ def confirm_source_deletion_markup(source_id: int) -> InlineKeyboardMarkup:
         [
             InlineKeyboardButton(
                 text="✅ Yes, Delete",
-                callback_data=f"confirm_delete_{source_id}"
+                callback_data=SourceCallback(action="confirm_delete", source_id=source_id).pack()
             ),
             InlineKeyboardButton(
                 text="❌ Cancel",
-                callback_data=f"source_info_{source_id}"
+                callback_data=SourceCallback(action="info", source_id=source_id).pack()
             )
         ]
     ]
@@ -143,12 +150,13 @@ def confirm_source_deletion_markup(source_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def subscription_management_markup(user_subscriptions: List[Source]) -> InlineKeyboardMarkup:
+def subscription_management_markup(user_subscriptions: Sequence) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for managing user subscriptions.
     
     Args:
-        user_subscriptions: List of sources the user is subscribed to
+        user_subscriptions: Rows for the sources the user is subscribed to
+            (anything exposing id, type and url)
     
     Returns:
         InlineKeyboardMarkup with subscription management options
@@ -165,18 +173,10 @@ def subscription_management_markup(user_subscriptions: List[Source]) -> InlineKe
     else:
         # Add buttons for each subscription (max 10)
         for source in user_subscriptions[:10]:
-            source_type_emoji = {
-                "rss": "📰",
-                "twitter": "🐦",
-                "facebook": "📘",
-                "instagram": "📸",
-                "website": "🌐"
-            }.get(source.type, "📄")
-            
             keyboard.append([
                 InlineKeyboardButton(
-                    text=f"{source_type_emoji} {source.url[:35]}...",
-                    callback_data=f"subscription_info_{source.id}"
+                    text=f"{SOURCE_EMOJI.get(source.type, DEFAULT_EMOJI)} {source.url[:35]}...",
+                    callback_data=SourceCallback(action="subscription_info", source_id=source.id).pack()
                 )
             ])
     
@@ -188,10 +188,13 @@ def subscription_management_markup(user_subscriptions: List[Source]) -> InlineKe
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@cache
 def help_markup() -> InlineKeyboardMarkup:
     """
     Create the help menu inline keyboard markup.
     
+    The markup is built once and shared; callers must not mutate it.
+    
     Returns:
         InlineKeyboardMarkup with help options
     """
@@ -212,10 +215,13 @@ def help_markup() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@cache
 def admin_markup() -> InlineKeyboardMarkup:
     """
     Create the admin panel inline keyboard markup.
     
+    The markup is built once and shared; callers must not mutate it.
+    
     Returns:
         InlineKeyboardMarkup with admin options
     """
@@ -6,7 +6,7 @@ providing a centralized configuration management system.
 """
 
 import os
-from typing import List
+from typing import FrozenSet
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -24,14 +24,16 @@ class Config:
     # Bot credentials
     BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
     
-    # Admin user IDs (comma-separated in env)
-    ADMIN_IDS: List[int] = [
+    # Admin user IDs (comma-separated in env), frozen for O(1) membership checks
+    ADMIN_IDS: FrozenSet[int] = frozenset(
         int(id_str.strip()) for id_str in os.getenv("ADMIN_IDS", "").split(",") 
         if id_str.strip().isdigit()
-    ]
+    )
     
     # Database configuration
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///database.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "25"))  # ignored for SQLite
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "50"))
     
     # Redis configuration for FSM storage
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -41,6 +43,8 @@ class Config:
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     USER_AGENT: str = os.getenv("USER_AGENT", "Mozilla/5.0 FeedAggregatorBot/1.0")
     RETRY_DELAY: int = int(os.getenv("RETRY_DELAY", "5"))  # seconds between retries
+    MAX_CONCURRENT_FETCHES: int = int(os.getenv("MAX_CONCURRENT_FETCHES", "16"))
+    MAX_RESPONSE_BYTES: int = int(os.getenv("MAX_RESPONSE_BYTES", str(5 * 1024 * 1024)))
     
     # Content settings
     MAX_POST_LENGTH: int = int(os.getenv("MAX_POST_LENGTH", "4000"))  # Telegram message limit
@@ -48,7 +52,12 @@ class Config:
     
     # Scheduler settings
     SCHEDULER_INTERVAL: int = int(os.getenv("SCHEDULER_INTERVAL", "300"))  # 5 minutes default
+    MAX_SOURCES_PER_TICK: int = int(os.getenv("MAX_SOURCES_PER_TICK", "500"))
+    SOURCE_BATCH_SIZE: int = int(os.getenv("SOURCE_BATCH_SIZE", "100"))
     MAX_ITEMS_PER_UPDATE: int = int(os.getenv("MAX_ITEMS_PER_UPDATE", "5"))
+    MAX_CONCURRENT_SENDS: int = int(os.getenv("MAX_CONCURRENT_SENDS", "25"))  # also caps messages per second
+    SENT_ITEMS_CACHE_SIZE: int = int(os.getenv("SENT_ITEMS_CACHE_SIZE", "200000"))
+    BROADCAST_CACHE_CHAT: str = os.getenv("BROADCAST_CACHE_CHAT", "")  # chat ID or @channel; empty disables
     
     # Logging configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -18,6 +18,7 @@ from utils.logger import setup_logger, logger
 from config import config
 from models.database import init_db
 from services.scheduler import SchedulerService
+from services.scraper import ScraperService
 
 
 async def main():
@@ -52,13 +53,18 @@ async def main():
         # Set up FSM storage
         storage = None
         try:
-            # Try Redis first with async connection test
-            storage = RedisStorage.from_url(config.REDIS_URL)
-            # Test the connection by creating a dummy key
-            await storage.redis.ping()
+            # Try Redis first; short connect timeouts keep an unreachable
+            # server from stalling startup before the in-memory fallback
+            storage = RedisStorage.from_url(
+                config.REDIS_URL,
+                connection_kwargs={"socket_connect_timeout": 1.0, "socket_keepalive": True}
+            )
+            await asyncio.wait_for(storage.redis.ping(), timeout=1.0)
             logger.info("✓ Successfully connected to Redis for FSM storage")
         except Exception as e:
-            logger.warning(f"Redis connection failed: {e}")
+            logger.warning(f"Redis connection failed: {e!r}")
+            if storage is not None:
+                await storage.close()
             logger.info("Falling back to in-memory storage (data will not persist across restarts)")
             storage = MemoryStorage()
         
@@ -67,14 +73,18 @@ async def main():
             token=config.BOT_TOKEN,
             default=DefaultBotProperties(parse_mode=ParseMode.HTML)
         )
-        dp = Dispatcher(storage=storage)
+        
+        # One scraper (and HTTP connection pool) shared by the handlers and the
+        # scheduler; aiogram injects it into handlers that declare a `scraper` argument
+        scraper = ScraperService()
+        dp = Dispatcher(storage=storage, scraper=scraper)
         
         # Set up handlers
         setup_handlers(dp)
         logger.info("Bot handlers configured")
         
         # Initialize and start scheduler
-        scheduler = SchedulerService(bot)
+        scheduler = SchedulerService(bot, scraper)
         scheduler_task = asyncio.create_task(scheduler.start())
         logger.info("Scheduler service started")
         
@@ -97,6 +107,7 @@ async def main():
             except asyncio.CancelledError:
                 pass
             
+            await scraper.close()
             await bot.session.close()
             logger.info("Bot shutdown complete")
     
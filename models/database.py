@@ -6,9 +6,11 @@ providing a clean interface for data persistence and retrieval.
 """
 
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Boolean, UniqueConstraint
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy import create_engine, event, Column, Integer, String, DateTime, ForeignKey, Boolean, Index, UniqueConstraint
+from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from config import config
 
 # Base class for all database models
@@ -72,16 +74,26 @@ class Source(Base):
     added_by = Column(Integer, ForeignKey('users.id'), nullable=False, doc="User who added this source")
     last_checked = Column(DateTime, nullable=True, doc="Last time source was checked for updates")
     last_updated = Column(DateTime, nullable=True, doc="Last time source had new content")
+    next_check_at = Column(DateTime, nullable=True, doc="Earliest time the scheduler checks this source again")
     check_count = Column(Integer, default=0, doc="Number of times source has been checked")
     error_count = Column(Integer, default=0, doc="Number of consecutive errors")
     
+    # HTTP cache validators used for conditional GET requests
+    etag = Column(String, nullable=True, doc="ETag returned with the last fetched feed")
+    last_modified = Column(String, nullable=True, doc="Last-Modified header returned with the last fetched feed")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, doc="When source was added")
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, doc="Last modification time")
     
     # Relationships
     user = relationship("User", back_populates="sources", doc="User who added this source")
-    subscriptions = relationship("Subscription", back_populates="source", cascade="all, delete-orphan", doc="Subscriptions to this source")
+    subscriptions = relationship("Subscription", back_populates="source", cascade="all, delete-orphan", passive_deletes=True, doc="Subscriptions to this source")
+    
+    __table_args__ = (
+        # Scheduler scan of active sources that are due for a check
+        Index('ix_sources_active_next_check', 'is_active', 'next_check_at'),
+    )
     
     def __repr__(self) -> str:
         return f"<Source(id={self.id}, type='{self.type}', url='{self.url[:50]}...')>"
@@ -101,7 +113,7 @@ class Subscription(Base):
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, doc="Subscriber user ID")
-    source_id = Column(Integer, ForeignKey('sources.id'), nullable=False, doc="Subscribed source ID")
+    source_id = Column(Integer, ForeignKey('sources.id', ondelete="CASCADE"), nullable=False, doc="Subscribed source ID")
     
     # Subscription settings
     is_active = Column(Boolean, default=True, doc="Whether subscription is active")
@@ -115,27 +127,144 @@ class Subscription(Base):
     user = relationship("User", back_populates="subscriptions", doc="Subscribed user")
     source = relationship("Source", back_populates="subscriptions", doc="Subscribed source")
     
-    # Ensure one subscription per user-source pair
     __table_args__ = (
+        # Ensure one subscription per user-source pair
         UniqueConstraint('user_id', 'source_id', name='unique_user_source_subscription'),
+        # Covers the "my active subscriptions" lookup including the join key
+        Index('ix_sub_user_active_source', 'user_id', 'is_active', 'source_id'),
+        # Scheduler lookup of notifiable subscribers; also serves source_id
+        # foreign key lookups such as the delete cascade
+        Index('ix_sub_source_active_notif', 'source_id', 'is_active', 'notification_enabled'),
     )
     
     def __repr__(self) -> str:
         return f"<Subscription(id={self.id}, user_id={self.user_id}, source_id={self.source_id})>"
 
 
+def _pool_options(url: str) -> dict:
+    """
+    Connection pool sizing for a database URL.
+    
+    SQLite serializes writes regardless of pool size, so it keeps the
+    SQLAlchemy defaults; server databases get a pool large enough for the
+    scheduler's concurrent sends.
+    
+    Args:
+        url: Database URL as configured in the environment
+    
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_size": config.DB_POOL_SIZE, "max_overflow": config.DB_MAX_OVERFLOW}
+
+
+def _async_database_url(url: str) -> str:
+    """
+    Translate a synchronous database URL into its asyncio driver equivalent.
+    
+    Args:
+        url: Database URL as configured in the environment
+    
+    Returns:
+        URL using an asyncio-compatible driver (aiosqlite, asyncpg)
+    
+    Raises:
+        ValueError: If the URL is not for SQLite or PostgreSQL
+    """
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if url.startswith(("sqlite+aiosqlite://", "postgresql+asyncpg://")):
+        return url
+    
+    # Only the scheme is reported, the rest of the URL may hold credentials
+    scheme = url.split("://", 1)[0]
+    raise ValueError(f"Unsupported DATABASE_URL scheme '{scheme}': use SQLite or PostgreSQL")
+
+
+# Resolved before any engine is created, so an unsupported database fails
+# with a clear message instead of a missing driver error
+ASYNC_DATABASE_URL = _async_database_url(config.DATABASE_URL)
+
 # Database engine configuration
 engine = create_engine(
     config.DATABASE_URL,
     echo=False,  # Set to True for SQL query logging
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=3600,  # Recycle connections every hour
+    **_pool_options(config.DATABASE_URL),
 )
 
 # Session factory
 Session = sessionmaker(bind=engine)
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """
+    Apply per-connection SQLite settings.
+    
+    SQLite ignores foreign key constraints (including ON DELETE CASCADE)
+    unless they are enabled on every new connection. WAL mode lets the
+    handlers read while the scheduler writes, and with it synchronous=NORMAL
+    is still safe against corruption.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
+
+# Async engine used by the bot handlers and the scheduler so queries never
+# block the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    **_pool_options(config.DATABASE_URL),
+)
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _configure_sqlite_connection)
+    event.listen(async_engine.sync_engine, "connect", _configure_sqlite_connection)
+
+# Async session factory; objects stay usable after commit since handlers
+# render them once the session has been closed
+AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+def upsert_insert(model):
+    """
+    Create an INSERT statement supporting ``ON CONFLICT`` for the active backend.
+    
+    Both PostgreSQL and SQLite provide ``on_conflict_do_update`` and
+    ``on_conflict_do_nothing`` on their dialect-specific insert constructs.
+    
+    Args:
+        model: ORM model or table to insert into
+    
+    Returns:
+        Dialect-specific Insert construct
+    
+    Raises:
+        ValueError: If the database is neither PostgreSQL nor SQLite
+    """
+    dialect = async_engine.dialect.name
+    if dialect == "postgresql":
+        return pg_insert(model)
+    if dialect == "sqlite":
+        return sqlite_insert(model)
+    raise ValueError(f"Upserts are not supported on {dialect}")
+
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -1,15 +1,60 @@
+from dataclasses import dataclass
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
 
-class FeedItem(BaseModel):
+# Emoji shown next to each source type in keyboards and update messages
+SOURCE_EMOJI = {
+    "rss": "📰",
+    "twitter": "🐦",
+    "facebook": "📘",
+    "instagram": "📸",
+    "website": "🌐",
+    "youtube": "📺",
+    "reddit": "🔴"
+}
+DEFAULT_EMOJI = "📄"
+
+def parse_published(value: str) -> Optional[datetime]:
+    """Parse a feed date (ISO 8601 or RFC 822) into a naive UTC datetime, or None"""
+    # fromisoformat only accepts the "Z" suffix from Python 3.11 on
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FeedItem:
+    """Scraped item; a plain slotted dataclass since one is built for every feed entry"""
     title: str
     url: str
     content: str
-    published_at: str = ""
+    published_at: Optional[datetime] = None  # naive UTC, parsed once at scrape time
     source_type: str
     
-    class Config:
-        from_attributes = True
+    def __post_init__(self):
+        value = self.published_at
+        if isinstance(value, str):
+            value = parse_published(value) if value else None
+        elif isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        object.__setattr__(self, "published_at", value)
+
+@dataclass
+class CacheValidators:
+    """HTTP cache validators of a source; refreshed by the scraper from each full response"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 class SourceCreate(BaseModel):
     url: str
@@ -1,21 +1,39 @@
-from models.schemas import FeedItem
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from typing import Optional
+
+from models.schemas import DEFAULT_EMOJI, SOURCE_EMOJI, FeedItem
 from config import config
 
+MESSAGE_TEMPLATE = "{emoji} <b>{title}</b>\n\n{content}\n\n🔗 <a href='{url}'>Read more</a>\n{published}"
+PUBLISHED_TEMPLATE = "⏰ {published_at}\n"
+
 def process_content(item: FeedItem) -> str:
     """Format content for Telegram"""
-    source_emoji = {
-        "twitter": "🐦",
-        "facebook": "📘",
-        "instagram": "📸",
-        "rss": "📰",
-        "website": "🌐"
-    }.get(item.source_type, "📄")
-    
-    content = f"{source_emoji} <b>{item.title}</b>\n\n"
-    content += f"{item.content}\n\n"
-    content += f"🔗 <a href='{item.url}'>Read more</a>\n"
-    
-    if item.published_at:
-        content += f"⏰ {item.published_at}\n"
-    
-    return content[:config.MAX_POST_LENGTH]
+    return _format(item.source_type, item.title, item.content, item.url, item.published_at)
+
+@lru_cache(maxsize=4096)
+def _format(source_type: str, title: str, content: str, url: str, published_at: Optional[datetime]) -> str:
+    """Build the message text with scraped fields HTML-escaped; memoized so repeated items are formatted once"""
+    fields = {
+        "emoji": SOURCE_EMOJI.get(source_type, DEFAULT_EMOJI),
+        "title": escape(title),
+        "content": escape(content),
+        "url": escape(url),
+        "published": PUBLISHED_TEMPLATE.format(published_at=published_at.isoformat()) if published_at else ""
+    }
+    text = MESSAGE_TEMPLATE.format_map(fields)
+
+    # Shorten the content rather than cut through the markup, without
+    # leaving half of an escaped entity behind
+    excess = len(text) - config.MAX_POST_LENGTH
+    if excess > 0:
+        shortened = fields["content"][:max(len(fields["content"]) - excess, 0)]
+        entity = shortened.rfind("&")
+        if entity != -1 and ";" not in shortened[entity:]:
+            shortened = shortened[:entity]
+        fields["content"] = shortened
+        text = MESSAGE_TEMPLATE.format_map(fields)
+
+    return text[:config.MAX_POST_LENGTH]
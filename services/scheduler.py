@@ -7,10 +7,17 @@ and rate limiting to ensure reliable operation.
 """
 
 import asyncio
+import hashlib
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from models.database import Session, Source, Subscription
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from cachetools import LRUCache
+from sqlalchemy import DateTime, bindparam, case, func, or_, select, true, update
+from sqlalchemy.orm import selectinload
+
+from models.database import AsyncSession, Source, Subscription
+from models.schemas import CacheValidators, FeedItem
 from services.scraper import ScraperService, ScraperError
 from services.content_processor import process_content
 from utils.logger import get_logger
@@ -18,6 +25,54 @@ from config import config
 
 logger = get_logger("scheduler")
 
+# Check interval overrides per source type, in seconds; other types use
+# SCHEDULER_INTERVAL. The placeholder scrapers never produce real content.
+SOURCE_CHECK_INTERVALS = {
+    "facebook": 24 * 3600,
+    "instagram": 24 * 3600,
+}
+
+# Failing sources back off exponentially, up to 2**MAX_BACKOFF_EXPONENT intervals
+MAX_BACKOFF_EXPONENT = 6
+
+# Minimum time a send occupies its concurrency slot (rate limiting)
+SEND_SLOT_SECONDS = 1.0
+
+# Outcomes of sending one update to one subscriber
+SEND_DELIVERED = "delivered"
+SEND_FAILED = "failed"
+SEND_BLOCKED = "blocked"  # the user blocked the bot or the chat is gone
+
+# Loads each source's notifiable subscriptions in one extra query for the
+# whole batch, instead of one query per source when updates are sent
+ACTIVE_SUBSCRIPTIONS = selectinload(
+    Source.subscriptions.and_(
+        Subscription.is_active == True,
+        Subscription.notification_enabled == True
+    )
+)
+
+# Records the outcome of a batch of source checks as one executemany UPDATE;
+# last_updated only changes for sources that had new items. The refreshed
+# cache validators are written here too, never through the ORM rows.
+_sources = Source.__table__
+RECORD_SOURCE_CHECKS = (
+    update(_sources)
+    .where(_sources.c.id == bindparam("_id"))
+    .values(
+        last_checked=bindparam("_last_checked"),
+        check_count=_sources.c.check_count + 1,
+        last_updated=func.coalesce(
+            bindparam("_last_updated", type_=DateTime), _sources.c.last_updated
+        ),
+        error_count=bindparam("_error_count"),
+        is_active=bindparam("_is_active"),
+        next_check_at=bindparam("_next_check_at"),
+        etag=bindparam("_etag"),
+        last_modified=bindparam("_last_modified"),
+    )
+)
+
 
 class SchedulerService:
     """
@@ -27,14 +82,19 @@ class SchedulerService:
     processes new content, and distributes updates to subscribed users.
     """
     
-    def __init__(self, bot):
+    def __init__(self, bot, scraper: Optional[ScraperService] = None):
         """
         Initialize the scheduler service.
         
         Args:
             bot: Telegram bot instance for sending messages
+            scraper: Shared scraper service; a private one is created if omitted
         """
         self.bot = bot
+        self.scraper = scraper if scraper is not None else ScraperService()
+        self._send_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_SENDS)
+        # Digests of recently sent items, so undated items are sent only once
+        self._sent_items = LRUCache(maxsize=config.SENT_ITEMS_CACHE_SIZE)
         self.is_running = False
         self.task: Optional[asyncio.Task] = None
         logger.info("SchedulerService initialized")
@@ -87,25 +147,37 @@ class SchedulerService:
         logger.info("Starting periodic source check")
         
         try:
-            with Session() as session:
-                # Get all active sources
-                sources = session.query(Source).filter(Source.is_active == True).all()
+            async with AsyncSession() as session:
+                # Stream the active sources that are due, most overdue first,
+                # so the first batch is scraped while later rows still arrive
+                result = await session.stream(
+                    select(Source)
+                    .options(ACTIVE_SUBSCRIPTIONS)
+                    .where(
+                        Source.is_active == True,
+                        or_(Source.next_check_at == None, Source.next_check_at <= start_time)
+                    )
+                    .order_by(Source.next_check_at.asc().nulls_first())
+                    .limit(config.MAX_SOURCES_PER_TICK)
+                    .execution_options(yield_per=config.SOURCE_BATCH_SIZE)
+                )
                 
-                if not sources:
-                    logger.info("No active sources to check")
-                    return
+                # Fetch each batch concurrently (bounded by the scraper) and
+                # notify subscribers of each source as soon as it is fetched.
+                # Nothing may be flushed here: notifications are written by
+                # another session while this one is still reading.
+                checks = []
+                with session.no_autoflush:
+                    async for sources in result.scalars().partitions():
+                        logger.info(f"Checking batch of {len(sources)} due sources")
+                        async for source, scraped, validators in self.scraper.scrape_as_completed(sources):
+                            checks.append(await self._process_scrape_result(source, scraped, validators))
                 
-                logger.info(f"Checking {len(sources)} active sources")
+                if not checks:
+                    logger.info("No sources due for checking")
+                    return
                 
-                # Process sources in batches to avoid overwhelming the system
-                batch_size = 10
-                for i in range(0, len(sources), batch_size):
-                    batch = sources[i:i + batch_size]
-                    await self._process_source_batch(batch, session)
-                    
-                    # Small delay between batches to be respectful
-                    if i + batch_size < len(sources):
-                        await asyncio.sleep(1)
+                await self._record_checks(checks, session)
         
         except Exception as e:
             logger.error(f"Error in source checking: {e}")
@@ -114,84 +186,141 @@ class SchedulerService:
             duration = (datetime.utcnow() - start_time).total_seconds()
             logger.info(f"Source check completed in {duration:.2f} seconds")
     
-    async def _process_source_batch(self, sources: List[Source], session: Session) -> None:
+    async def _check_single_source(self, source: Source, session: AsyncSession) -> None:
         """
-        Process a batch of sources concurrently.
+        Check a single source for new content.
         
         Args:
-            sources: List of sources to process
+            source: Source to check
             session: Database session
         """
-        tasks = []
-        for source in sources:
-            task = asyncio.create_task(self._check_single_source(source, session))
-            tasks.append(task)
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Log any exceptions that occurred
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error checking source {sources[i].url}: {result}")
+        logger.debug(f"Checking source: {source.url} (type: {source.type})")
+        
+        (result, validators), = await self.scraper.scrape_many([source])
+        check = await self._process_scrape_result(source, result, validators)
+        await self._record_checks([check], session)
     
-    async def _check_single_source(self, source: Source, session: Session) -> None:
+    async def _process_scrape_result(
+        self,
+        source: Source,
+        result: Union[List[FeedItem], BaseException],
+        validators: Optional[CacheValidators] = None
+    ) -> Dict[str, Any]:
         """
-        Check a single source for new content.
+        Send out any new items from a scraped source and work out its new state.
+        
+        The source itself is not modified; the returned parameters are
+        written for the whole batch by _record_checks.
         
         Args:
-            source: Source to check
-            session: Database session
+            source: Source that was scraped
+            result: Scraped items, or the exception raised while scraping
+            validators: Cache validators after the scrape; the stored ones
+                are kept if omitted
+            
+        Returns:
+            Bind parameters for RECORD_SOURCE_CHECKS
         """
-        logger.debug(f"Checking source: {source.url} (type: {source.type})")
+        now = datetime.utcnow()
+        last_updated = None
+        error_count = source.error_count or 0
+        is_active = source.is_active
         
         try:
-            # Update check timestamp
-            source.last_checked = datetime.utcnow()
-            source.check_count += 1
-            
-            # Scrape the source
-            async with ScraperService() as scraper:
-                items = await scraper.scrape_source(source.url, source.type)
-            
-            if not items:
-                logger.debug(f"No items found from source {source.url}")
-                session.commit()
-                return
+            if isinstance(result, BaseException):
+                raise result
+            items = result
+            error_count = 0  # Any successful fetch ends an error streak, even one with nothing new
             
             # Filter for new items
-            cutoff_time = source.last_updated or datetime.utcnow() - timedelta(hours=24)
+            cutoff_time = source.last_updated or now - timedelta(hours=24)
             new_items = self._filter_new_items(items, cutoff_time)
+            keyed = [(item, self._item_key(source, item)) for item in new_items]
+            unsent = [(item, key) for item, key in keyed if key not in self._sent_items]
             
-            if new_items:
-                logger.info(f"Found {len(new_items)} new items from {source.url}")
+            if unsent:
+                logger.info(f"Found {len(unsent)} new items from {source.url}")
                 
-                # Send updates to subscribers
-                await self._send_updates_to_subscribers(source, new_items, session)
+                # Send updates to subscribers; only the items that fit in one
+                # update are marked as sent
+                unsent = unsent[:config.MAX_ITEMS_PER_UPDATE]
+                await self._send_updates_to_subscribers(source, [item for item, _ in unsent])
+                for _, key in unsent:
+                    self._sent_items[key] = True
                 
-                # Update source metadata
-                source.last_updated = datetime.utcnow()
-                source.error_count = 0  # Reset error count on success
-            else:
+                last_updated = datetime.utcnow()
+            elif items:
                 logger.debug(f"No new items from source {source.url}")
-            
-            session.commit()
+            else:
+                logger.debug(f"No items found from source {source.url}")
             
         except ScraperError as e:
             logger.error(f"Scraping error for source {source.url}: {e}")
-            source.error_count += 1
+            error_count += 1
             
             # Disable source if too many consecutive errors
-            if source.error_count >= 10:
-                logger.warning(f"Disabling source {source.url} due to {source.error_count} consecutive errors")
-                source.is_active = False
-            
-            session.commit()
+            if error_count >= 10:
+                logger.warning(f"Disabling source {source.url} due to {error_count} consecutive errors")
+                is_active = False
             
         except Exception as e:
             logger.error(f"Unexpected error checking source {source.url}: {e}")
-            source.error_count += 1
-            session.commit()
+            error_count += 1
+        
+        return {
+            "_id": source.id,
+            "_last_checked": now,
+            "_last_updated": last_updated,
+            "_error_count": error_count,
+            "_is_active": is_active,
+            "_next_check_at": self._next_check_at(source.type, error_count),
+            "_etag": validators.etag if validators else source.etag,
+            "_last_modified": validators.last_modified if validators else source.last_modified,
+        }
+    
+    async def _record_checks(self, checks: List[Dict[str, Any]], session: AsyncSession) -> None:
+        """
+        Write the outcome of a batch of source checks and commit.
+        
+        Args:
+            checks: Bind parameters from _process_scrape_result, one per source
+            session: Database session
+        """
+        if checks:
+            await session.execute(RECORD_SOURCE_CHECKS, checks)
+        await session.commit()
+    
+    def _next_check_at(self, source_type: str, error_count: int) -> datetime:
+        """
+        Work out when the scheduler should next check a source.
+        
+        The base interval depends on the source type; sources with
+        consecutive errors back off exponentially.
+        
+        Args:
+            source_type: Type of the source
+            error_count: Consecutive errors after the latest check
+            
+        Returns:
+            Time of the next check
+        """
+        interval = SOURCE_CHECK_INTERVALS.get(source_type, config.SCHEDULER_INTERVAL)
+        backoff = 2 ** min(error_count, MAX_BACKOFF_EXPONENT)
+        return datetime.utcnow() + timedelta(seconds=interval * backoff)
+    
+    @staticmethod
+    def _item_key(source: Source, item: FeedItem) -> bytes:
+        """
+        Build the sent-items cache key for an item of a source.
+        
+        Args:
+            source: Source the item was scraped from
+            item: Scraped item
+            
+        Returns:
+            16-byte digest of the source ID and item URL
+        """
+        return hashlib.blake2b(f"{source.id} {item.url}".encode(), digest_size=16).digest()
     
     def _filter_new_items(self, items, cutoff_time: datetime) -> List:
         """
@@ -204,47 +333,30 @@ class SchedulerService:
         Returns:
             List of new items
         """
-        new_items = []
-        
-        for item in items:
-            if not item.published_at:
-                # If no publish date, consider it new
-                new_items.append(item)
-                continue
-            
-            try:
-                # Try to parse the published date
-                if 'T' in item.published_at:
-                    pub_date = datetime.fromisoformat(item.published_at.replace('Z', '+00:00'))
-                else:
-                    # Handle other date formats as needed
-                    pub_date = datetime.strptime(item.published_at, '%Y-%m-%d %H:%M:%S')
-                
-                if pub_date > cutoff_time:
-                    new_items.append(item)
-                    
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Could not parse date '{item.published_at}': {e}")
-                # If we can't parse the date, include the item to be safe
-                new_items.append(item)
-        
-        return new_items
+        # Dates are parsed to naive UTC when items are scraped; undated items
+        # are always considered new
+        return [
+            item for item in items
+            if item.published_at is None or item.published_at > cutoff_time
+        ]
     
-    async def _send_updates_to_subscribers(self, source: Source, items: List, session: Session) -> None:
+    async def _send_updates_to_subscribers(self, source: Source, items: List) -> None:
         """
         Send new content updates to all subscribers of a source.
         
+        The resulting subscription changes are written in their own short
+        transaction, so no row locks are held while messages are being sent.
+        
         Args:
             source: Source that has new content
             items: List of new FeedItem objects
-            session: Database session
         """
-        # Get all active subscriptions for this source
-        subscriptions = session.query(Subscription).filter(
-            Subscription.source_id == source.id,
-            Subscription.is_active == True,
-            Subscription.notification_enabled == True
-        ).all()
+        # Subscriptions are normally preloaded with ACTIVE_SUBSCRIPTIONS; the
+        # filter keeps callers that pass a plainly loaded source correct
+        subscriptions = [
+            subscription for subscription in source.subscriptions
+            if subscription.is_active and subscription.notification_enabled
+        ]
         
         if not subscriptions:
             logger.debug(f"No active subscribers for source {source.url}")
@@ -252,33 +364,138 @@ class SchedulerService:
         
         logger.info(f"Sending updates to {len(subscriptions)} subscribers for source {source.url}")
         
-        # Send each item to all subscribers
+        # Send each item to all subscribers in parallel; items stay in order
+        notified_ids = set()
+        dead_ids = set()
         for item in items[:config.MAX_ITEMS_PER_UPDATE]:  # Limit items per update
+            subscriptions = [
+                subscription for subscription in subscriptions
+                if subscription.id not in dead_ids
+            ]
+            if not subscriptions:
+                break
+            
             formatted_content = process_content(item)
+            origin_id = None
+            if len(subscriptions) > 1:
+                origin_id = await self._post_to_broadcast_cache(formatted_content)
+            outcomes = await asyncio.gather(*(
+                self._send_update(subscription, formatted_content, origin_id)
+                for subscription in subscriptions
+            ))
+            for subscription, outcome in zip(subscriptions, outcomes):
+                if outcome == SEND_DELIVERED:
+                    notified_ids.add(subscription.id)
+                elif outcome == SEND_BLOCKED:
+                    dead_ids.add(subscription.id)
+        
+        if not notified_ids and not dead_ids:
+            return
+        
+        async with AsyncSession.begin() as session:
+            # Record the notification time with one UPDATE instead of one per row
+            if notified_ids:
+                await session.execute(
+                    update(Subscription)
+                    .where(Subscription.id.in_(notified_ids))
+                    .values(last_notified=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+            
+            # Subscriptions whose chat blocked the bot or is gone are
+            # deactivated, so later ticks no longer select or message them
+            if dead_ids:
+                logger.warning(f"Disabling {len(dead_ids)} subscriptions of unreachable users")
+                await session.execute(
+                    update(Subscription)
+                    .where(Subscription.id.in_(dead_ids))
+                    .values(is_active=False)
+                    .execution_options(synchronize_session=False)
+                )
+    
+    async def _post_to_broadcast_cache(self, text: str) -> Optional[int]:
+        """
+        Post a formatted update once to the broadcast cache chat.
+        
+        Subscribers then receive server-side copies of this message instead
+        of Telegram parsing the same HTML again for every send.
+        
+        Args:
+            text: Formatted message text
             
-            for subscription in subscriptions:
-                try:
+        Returns:
+            Message ID in the cache chat, or None if the cache chat is not
+            configured or the post failed
+        """
+        if not config.BROADCAST_CACHE_CHAT:
+            return None
+        
+        async with self._send_semaphore:
+            try:
+                origin = await self.bot.send_message(
+                    chat_id=config.BROADCAST_CACHE_CHAT,
+                    text=text,
+                    parse_mode="HTML",
+                    disable_web_page_preview=False
+                )
+                return origin.message_id
+                
+            except Exception as e:
+                logger.error(f"Error posting to broadcast cache chat, sending directly: {e}")
+                return None
+    
+    async def _send_update(self, subscription: Subscription, text: str,
+                           origin_id: Optional[int] = None) -> str:
+        """
+        Send one formatted update to one subscriber.
+        
+        Each send holds a slot of the shared send semaphore for at least
+        SEND_SLOT_SECONDS, so no more than MAX_CONCURRENT_SENDS messages go
+        out per second across all sources.
+        
+        Args:
+            subscription: Subscription to notify
+            text: Formatted message text
+            origin_id: Message ID of the same text in the broadcast cache
+                chat; when given, the message is copied instead of sent
+            
+        Returns:
+            SEND_DELIVERED, SEND_BLOCKED if the user blocked the bot or the
+            chat no longer exists, SEND_FAILED otherwise
+        """
+        loop = asyncio.get_running_loop()
+        async with self._send_semaphore:
+            started = loop.time()
+            try:
+                if origin_id is not None:
+                    await self.bot.copy_message(
+                        chat_id=subscription.user_id,
+                        from_chat_id=config.BROADCAST_CACHE_CHAT,
+                        message_id=origin_id
+                    )
+                else:
                     await self.bot.send_message(
                         chat_id=subscription.user_id,
-                        text=formatted_content,
+                        text=text,
                         parse_mode="HTML",
                         disable_web_page_preview=False
                     )
-                    
-                    # Update last notification time
-                    subscription.last_notified = datetime.utcnow()
-                    
-                    # Add small delay to avoid rate limiting
-                    await asyncio.sleep(0.1)
-                    
-                except Exception as e:
-                    logger.error(f"Error sending update to user {subscription.user_id}: {e}")
-                    
-                    # If it's a blocked user error, we might want to handle it
-                    if "blocked" in str(e).lower() or "chat not found" in str(e).lower():
-                        logger.warning(f"User {subscription.user_id} appears to have blocked the bot")
-                        # Optionally disable the subscription
-                        # subscription.is_active = False
+                return SEND_DELIVERED
+                
+            except Exception as e:
+                logger.error(f"Error sending update to user {subscription.user_id}: {e}")
+                
+                if isinstance(e, TelegramForbiddenError) or (
+                    isinstance(e, TelegramBadRequest) and "chat not found" in str(e).lower()
+                ):
+                    logger.warning(f"User {subscription.user_id} appears to have blocked the bot")
+                    return SEND_BLOCKED
+                return SEND_FAILED
+            
+            finally:
+                remaining = SEND_SLOT_SECONDS - (loop.time() - started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
     
     async def force_check_source(self, source_id: int) -> bool:
         """
@@ -291,8 +508,8 @@ class SchedulerService:
             True if check was successful, False otherwise
         """
         try:
-            with Session() as session:
-                source = session.query(Source).filter(Source.id == source_id).first()
+            async with AsyncSession() as session:
+                source = await session.get(Source, source_id, options=[ACTIVE_SUBSCRIPTIONS])
                 
                 if not source:
                     logger.error(f"Source with ID {source_id} not found")
@@ -313,12 +530,28 @@ class SchedulerService:
         Returns:
             Dictionary with scheduler statistics
         """
-        with Session() as session:
-            total_sources = session.query(Source).count()
-            active_sources = session.query(Source).filter(Source.is_active == True).count()
-            error_sources = session.query(Source).filter(Source.error_count > 0).count()
-            total_subscriptions = session.query(Subscription).count()
-            active_subscriptions = session.query(Subscription).filter(Subscription.is_active == True).count()
+        # Conditional aggregates per table, cross-joined into a single row so
+        # all five counts come back in one round-trip
+        sources = select(
+            func.count(Source.id).label("total"),
+            func.coalesce(func.sum(case((Source.is_active == True, 1), else_=0)), 0).label("active"),
+            func.coalesce(func.sum(case((Source.error_count > 0, 1), else_=0)), 0).label("errors")
+        ).subquery()
+        subscriptions = select(
+            func.count(Subscription.id).label("total"),
+            func.coalesce(func.sum(case((Subscription.is_active == True, 1), else_=0)), 0).label("active")
+        ).subquery()
+        
+        async with AsyncSession() as session:
+            (
+                total_sources, active_sources, error_sources,
+                total_subscriptions, active_subscriptions
+            ) = (await session.execute(
+                select(
+                    sources.c.total, sources.c.active, sources.c.errors,
+                    subscriptions.c.total, subscriptions.c.active
+                ).select_from(sources.join(subscriptions, true()))
+            )).one()
             
             return {
                 "is_running": self.is_running,
@@ -341,7 +574,10 @@ async def check_sources(bot) -> None:
     """
     logger.warning("Using legacy check_sources function. Consider migrating to SchedulerService.")
     scheduler = SchedulerService(bot)
-    await scheduler._check_all_sources()
+    try:
+        await scheduler._check_all_sources()
+    finally:
+        await scheduler.scraper.close()
 
 
 async def send_updates(bot, source, items) -> None:
@@ -353,9 +589,7 @@ async def send_updates(bot, source, items) -> None:
     """
     logger.warning("Using legacy send_updates function. Consider migrating to SchedulerService.")
     scheduler = SchedulerService(bot)
-    
-    with Session() as session:
-        await scheduler._send_updates_to_subscribers(source, items, session)
+    await scheduler._send_updates_to_subscribers(source, items)
 
 
 async def start_scheduler(bot) -> None:
@@ -377,4 +611,5 @@ async def start_scheduler(bot) -> None:
         logger.info("Scheduler interrupted by user")
     finally:
         await scheduler.stop()
+        await scheduler.scraper.close()
         logger.info("Scheduler service stopped")
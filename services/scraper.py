@@ -6,25 +6,255 @@ including RSS feeds, social media platforms, and generic websites.
 Includes robust error handling, retry logic, and rate limiting.
 """
 
-import re
 import asyncio
+import hashlib
+import html
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import aiohttp
 import feedparser
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from urllib.parse import urlparse, urljoin
+from lxml import etree
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 from datetime import datetime, timedelta
 
-from models.schemas import FeedItem
+from models.schemas import CacheValidators, FeedItem
 from config import config
 from utils.logger import get_logger
 
 logger = get_logger("scraper")
 
+# Source type for each platform, keyed on the registrable domain (last two
+# host labels), so www. and mobile subdomains resolve with one lookup
+SOURCE_TYPE_BY_DOMAIN = {
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "facebook.com": "facebook",
+    "fb.com": "facebook",
+    "instagram.com": "instagram",
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "reddit.com": "reddit",
+}
+
+# URL shapes that identify a feed without fetching it
+RSS_URL_SUFFIXES = (".rss", ".xml")
+RSS_PATH_HINTS = ("/feed", "/rss", "/atom")
+
+# Scraper method for each source type
+SCRAPER_METHODS = {
+    "rss": "_scrape_rss",
+    "twitter": "_scrape_twitter",
+    "facebook": "_scrape_facebook",
+    "instagram": "_scrape_instagram",
+    "youtube": "_scrape_youtube",
+    "reddit": "_scrape_reddit",
+    "website": "_scrape_website",
+}
+
+# Scrapers that accept cache validators for conditional GET
+CONDITIONAL_SCRAPERS = frozenset({"_scrape_rss", "_scrape_website"})
+
+# Article lookup for generic websites: article-like elements are matched while
+# the page streams in, the XPath fallbacks run on the full document if none exist.
+# All XPath expressions are compiled once here rather than on every call.
+WEBSITE_CHUNK_SIZE = 65536
+WEBSITE_ARTICLE_CLASSES = ("news-item", "blog-post")
+WEBSITE_FALLBACK_XPATHS = (
+    etree.XPath(
+        '//div[contains(@class, "article") or contains(@class, "post") or contains(@class, "entry")'
+        ' or contains(@class, "content")]'
+    ),
+    etree.XPath('//p[string-length(normalize-space()) >= 100]'),
+)
+ARTICLE_TITLE_XPATH = etree.XPath('(.//h1 | .//h2 | .//h3 | .//h4 | .//h5 | .//h6)[1]')
+ARTICLE_LINK_XPATH = etree.XPath('(.//a[@href])[1]/@href')
+
+# Streaming feed parsing: entries are read as the body arrives and the
+# download stops once MAX_ITEMS_PER_UPDATE entries are parsed. Tags are
+# matched by local name so RSS 2.0, RSS 1.0 and Atom share one path.
+RSS_CHUNK_SIZE = 16384
+FEED_ENTRY_TAGS = frozenset({"item", "entry"})
+FEED_CONTENT_TAGS = ("description", "summary", "content")
+FEED_DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+# Threads for the pure-Python feedparser fallback, so a slow parse does not
+# stall the event loop
+FEEDPARSER_WORKERS = 4
+
+# RSS mirrors tried for Twitter profiles, all at once; mirrors are often
+# dead, so each gets a short timeout
+TWITTER_FEED_MIRRORS = ("https://nitter.net/{username}/rss",)
+TWITTER_MIRROR_TIMEOUT = 5
+
+# Tag stripping for feed descriptions; script, style, noscript and iframe
+# bodies and comments are dropped together with their markup
+HTML_STRIP_RE = re.compile(
+    r"<(script|style|noscript|iframe)\b[^>]*>.*?</\1\s*>|<!--.*?-->|<[^>]+>", re.IGNORECASE | re.DOTALL
+)
+
+# Content sniffing only looks at the start of the body for feed markers
+RSS_SNIFF_BYTES = 4096
+RSS_CONTENT_MARKERS = (b"<rss", b"<feed", b"application/rss+xml", b"application/atom+xml")
+
+# Responses that ask the client to slow down; the host is not requested
+# again until its Retry-After / X-RateLimit-Reset time has passed
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+MAX_HOST_BACKOFF_SECONDS = 3600
+
+# Retry delays grow exponentially up to a cap and are jittered so sources
+# failing together do not retry in lockstep. Client errors other than these
+# are permanent and are not retried at all.
+MAX_RETRY_DELAY_SECONDS = 30.0
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+# Content sniffing results are kept per URL; the oldest entry is evicted
+# once the cache is full
+RSS_PROBE_CACHE_SIZE = 10000
+
+
+def _host(url: str) -> str:
+    """
+    Extract the lowercased host name from an absolute URL.
+    
+    A plain string split is enough for source type detection and avoids
+    building a full urlparse() result on every call.
+    
+    Args:
+        url: URL to inspect
+        
+    Returns:
+        Host name without credentials or port, or "" if the URL has none
+    """
+    _, sep, rest = url.partition("://")
+    if not sep:
+        return ""
+    for delimiter in "/?#":
+        rest = rest.partition(delimiter)[0]
+    return rest.rpartition("@")[2].partition(":")[0].lower()
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """
+    Read how long a rate-limited host asked the client to wait.
+    
+    Args:
+        headers: Response headers
+        
+    Returns:
+        Seconds to wait from Retry-After (seconds or HTTP date) or
+        X-RateLimit-Reset (seconds or epoch timestamp), or None if neither
+        header is present and valid
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+        try:
+            return parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            pass
+    
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        # Large values are absolute epoch timestamps, small ones a delay
+        return value - time.time() if value > 1e9 else value
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_by_domain(domain: str) -> Optional[str]:
+    """
+    Look up the platform source type for a host name.
+    
+    Args:
+        domain: Lowercased host name
+        
+    Returns:
+        Source type for known platforms (matching whole labels only, so
+        x.com but not netflix.com), or None
+    """
+    return SOURCE_TYPE_BY_DOMAIN.get(".".join(domain.rsplit(".", 2)[-2:]))
+
+
+@lru_cache(maxsize=1024)
+def _youtube_rss_url(channel_url: str) -> Optional[str]:
+    """
+    Map a YouTube channel URL to the channel's RSS feed URL.
+    
+    Args:
+        channel_url: YouTube channel URL
+        
+    Returns:
+        Feed URL for /channel/<id> URLs, or None if the URL has no channel ID
+    """
+    if "/channel/" not in channel_url:
+        return None
+    channel_id = channel_url.split("/channel/")[1].split("/")[0]
+    return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+
+
+@lru_cache(maxsize=1024)
+def _reddit_rss_url(url: str) -> str:
+    """
+    Map a Reddit subreddit or user URL to its RSS feed URL.
+    
+    Args:
+        url: Reddit URL
+        
+    Returns:
+        Feed URL
+    """
+    return url + ".rss" if url.endswith("/") else url + "/.rss"
+
+
+def _is_article_element(element) -> bool:
+    """
+    Check whether a parsed element looks like a self-contained article.
+    
+    Args:
+        element: lxml element emitted by the streaming HTML parser
+        
+    Returns:
+        True for <article>, role="article" and known article container classes
+    """
+    if element.tag == "article" or element.get("role") == "article":
+        return True
+    classes = element.get("class", "")
+    return any(name in classes for name in WEBSITE_ARTICLE_CLASSES)
+
+
+def _validators_of(source) -> CacheValidators:
+    """
+    Copy a source's stored cache validators, so scraping never modifies the source.
+    
+    Args:
+        source: Object that may carry ``etag``/``last_modified`` attributes
+        
+    Returns:
+        Cache validators to send and refresh for this source
+    """
+    return CacheValidators(
+        etag=getattr(source, "etag", None),
+        last_modified=getattr(source, "last_modified", None),
+    )
+
 
 class ScraperError(Exception):
     """Custom exception for scraping-related errors."""
-    pass
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
 
 
 class ScraperService:
@@ -37,17 +267,76 @@ class ScraperService:
     """
     
     def __init__(self):
-        """Initialize the scraper service with HTTP session and configuration."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT),
-            headers={"User-Agent": config.USER_AGENT},
-            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
-        )
+        """Initialize the scraper service; the HTTP session is created on first use."""
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._fetch_semaphore = asyncio.BoundedSemaphore(config.MAX_CONCURRENT_FETCHES)
+        # Feed URL -> (body digest, items parsed from that body)
+        self._parse_cache: Dict[str, Tuple[bytes, List[FeedItem]]] = {}
+        self._rss_probe_cache: Dict[str, str] = {}
+        self._host_next_ok: Dict[str, float] = {}  # host -> event loop time
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
         logger.info("ScraperService initialized")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+        
+        The session is created lazily so that it is always bound to the running
+        event loop. Its connector keeps connections alive and caches DNS lookups,
+        so repeated fetches from the same host skip the TCP/TLS handshake.
+        
+        Returns:
+            The aiohttp client session used for all requests
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT, sock_connect=5),
+                headers={"User-Agent": config.USER_AGENT},
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True  # reclaim TLS sockets peers drop uncleanly
+                )
+            )
+        return self.session
+    
+    def classify_url(self, url: str) -> Optional[str]:
+        """
+        Detect the type of source from the URL alone, without any I/O.
+        
+        Args:
+            url: The URL to analyze
+            
+        Returns:
+            Source type string for platform and feed-shaped URLs, or None if
+            only the page content can tell
+            
+        Raises:
+            ScraperError: If the URL is not http(s) or has no host
+        """
+        domain = _host(url)
+        if not domain or not url.lower().startswith(("http://", "https://")):
+            raise ScraperError(f"Invalid URL: {url}")
+        
+        logger.debug(f"Detecting source type for domain: {domain}")
+        
+        # Social media platform detection
+        source_type = _classify_by_domain(domain)
+        if source_type:
+            return source_type
+        
+        # RSS feed detection by URL pattern
+        url_l = url.lower()
+        if url_l.endswith(RSS_URL_SUFFIXES) or any(part in url_l for part in RSS_PATH_HINTS):
+            return "rss"
+        
+        return None
+    
     async def detect_source_type(self, url: str) -> str:
         """
-        Detect the type of source based on URL patterns.
+        Detect the type of source based on URL patterns, then page content.
         
         Args:
             url: The URL to analyze
@@ -59,28 +348,9 @@ class ScraperService:
             ScraperError: If URL is invalid or detection fails
         """
         try:
-            parsed_url = urlparse(url)
-            if not parsed_url.netloc:
-                raise ScraperError(f"Invalid URL: {url}")
-                
-            domain = parsed_url.netloc.lower()
-            logger.debug(f"Detecting source type for domain: {domain}")
-            
-            # Social media platform detection
-            if "twitter.com" in domain or "x.com" in domain:
-                return "twitter"
-            elif "facebook.com" in domain or "fb.com" in domain:
-                return "facebook"
-            elif "instagram.com" in domain:
-                return "instagram"
-            elif "youtube.com" in domain or "youtu.be" in domain:
-                return "youtube"
-            elif "reddit.com" in domain:
-                return "reddit"
-            
-            # RSS feed detection by URL pattern
-            if re.search(r"\.(rss|xml)$|/feed|/rss|/atom", url, re.I):
-                return "rss"
+            source_type = self.classify_url(url)
+            if source_type:
+                return source_type
             
             # Try to detect RSS feed by content
             try:
@@ -98,41 +368,56 @@ class ScraperService:
         """
         Try to detect RSS feed by analyzing page content.
         
+        Results of successful fetches are cached per URL for the lifetime of
+        the service, so adding the same URL again does not refetch it.
+        
         Args:
             url: URL to check
             
         Returns:
             "rss" if RSS feed detected, "website" otherwise
         """
-        async with self.session.get(url) as response:
+        cached = self._rss_probe_cache.get(url)
+        if cached is not None:
+            return cached
+        
+        session = await self._get_session()
+        async with session.get(url) as response:
             if response.status != 200:
                 return "website"
                 
             content_type = response.headers.get('content-type', '').lower()
             if 'xml' in content_type or 'rss' in content_type:
-                return "rss"
-            
-            text = await response.text()
-            soup = BeautifulSoup(text, 'lxml')
-            
-            # Check for RSS/Atom feed indicators
-            if soup.find('rss') or soup.find('feed') or soup.find('atom'):
-                return "rss"
-            
-            # Look for RSS feed links in HTML
-            rss_links = soup.find_all('link', type=['application/rss+xml', 'application/atom+xml'])
-            if rss_links:
-                return "rss"
-            
-            return "website"
+                result = "rss"
+            else:
+                # Feed roots and <link rel="alternate"> feed hints live at the
+                # top of the document, so the first few KB are enough to decide
+                head = b""
+                while len(head) < RSS_SNIFF_BYTES:
+                    chunk = await response.content.read(RSS_SNIFF_BYTES - len(head))
+                    if not chunk:
+                        break
+                    head += chunk
+                
+                head = head.lower()
+                result = "rss" if any(marker in head for marker in RSS_CONTENT_MARKERS) else "website"
+        
+        if len(self._rss_probe_cache) >= RSS_PROBE_CACHE_SIZE:
+            del self._rss_probe_cache[next(iter(self._rss_probe_cache))]
+        self._rss_probe_cache[url] = result
+        return result
     
-    async def scrape_source(self, source_url: str, source_type: str) -> List[FeedItem]:
+    async def scrape_source(
+        self, source_url: str, source_type: str, validators: Optional[CacheValidators] = None
+    ) -> List[FeedItem]:
         """
         Scrape content from a source based on its type.
         
         Args:
             source_url: URL of the source to scrape
             source_type: Type of source (rss, twitter, etc.)
+            validators: Optional cache validators used for conditional GET on
+                feeds and websites; updated in place from the response
             
         Returns:
             List of FeedItem objects containing scraped content
@@ -142,50 +427,230 @@ class ScraperService:
         """
         logger.info(f"Scraping {source_type} source: {source_url}")
         
+        # Resolve the scraper once, not on every retry; unknown types are
+        # treated as generic websites
+        method = SCRAPER_METHODS.get(source_type, "_scrape_website")
+        scrape = getattr(self, method)
+        args = (source_url, validators) if method in CONDITIONAL_SCRAPERS else (source_url,)
+        
         for attempt in range(config.MAX_RETRIES + 1):
+            # Honour a back-off requested by the host; long ones fail fast
+            # and the scheduler tries again on a later run
+            wait = self._host_wait(source_url)
+            if wait > config.REQUEST_TIMEOUT:
+                raise ScraperError(f"Host of {source_url} is rate limited for another {wait:.0f} seconds")
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            # Every caller shares the fetch limit, which bounds both open
+            # connections and the response bodies held in memory at once.
+            # Slots are only held for the request itself, never while sleeping.
             try:
-                if source_type == "rss":
-                    return await self._scrape_rss(source_url)
-                elif source_type == "twitter":
-                    return await self._scrape_twitter(source_url)
-                elif source_type == "facebook":
-                    return await self._scrape_facebook(source_url)
-                elif source_type == "instagram":
-                    return await self._scrape_instagram(source_url)
-                elif source_type == "youtube":
-                    return await self._scrape_youtube(source_url)
-                elif source_type == "reddit":
-                    return await self._scrape_reddit(source_url)
-                else:
-                    return await self._scrape_website(source_url)
-                    
+                async with self._fetch_semaphore:
+                    return await scrape(*args)
             except Exception as e:
                 logger.warning(f"Scraping attempt {attempt + 1} failed for {source_url}: {e}")
                 
+                # A missing or forbidden page will not appear on a retry
+                status = getattr(e, "status", None)
+                if status and 400 <= status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+                    raise ScraperError(f"Failed to scrape source: {e}", status)
+                
                 if attempt < config.MAX_RETRIES:
-                    delay = config.RETRY_DELAY * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {delay} seconds...")
+                    # Capped exponential backoff with jitter
+                    delay = min(MAX_RETRY_DELAY_SECONDS, config.RETRY_DELAY * (2 ** attempt))
+                    delay *= random.uniform(0.5, 1.5)
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
                     await asyncio.sleep(delay)
                 else:
                     logger.error(f"All scraping attempts failed for {source_url}")
                     raise ScraperError(f"Failed to scrape source after {config.MAX_RETRIES + 1} attempts: {e}")
     
-    async def _scrape_rss(self, url: str) -> List[FeedItem]:
+    def _get_parse_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the thread pool for feedparser, creating it on first use.
+        
+        Returns:
+            Executor running feedparser.parse off the event loop
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ThreadPoolExecutor(
+                max_workers=FEEDPARSER_WORKERS, thread_name_prefix="feedparse"
+            )
+        return self._parse_pool
+    
+    def _host_wait(self, url: str) -> float:
+        """
+        Seconds until the host of a URL may be requested again.
+        
+        Args:
+            url: URL about to be requested
+            
+        Returns:
+            Remaining back-off in seconds, or 0 if the host is not limited
+        """
+        host = _host(url)
+        next_ok = self._host_next_ok.get(host)
+        if next_ok is None:
+            return 0
+        
+        wait = next_ok - asyncio.get_running_loop().time()
+        if wait <= 0:
+            del self._host_next_ok[host]
+            return 0
+        return wait
+    
+    def _defer_host(self, url: str, response: aiohttp.ClientResponse) -> None:
+        """
+        Record the back-off a rate-limited response asked for.
+        
+        Args:
+            url: URL that was requested
+            response: Response with a status in RATE_LIMIT_STATUSES
+        """
+        wait = _retry_after_seconds(response.headers)
+        if wait is None or wait <= 0:
+            wait = config.RETRY_DELAY
+        wait = min(wait, MAX_HOST_BACKOFF_SECONDS)
+        
+        host = _host(url)
+        logger.warning(f"Host {host} is rate limiting requests, backing off for {wait:.0f} seconds")
+        self._host_next_ok[host] = asyncio.get_running_loop().time() + wait
+    
+    async def scrape_many(
+        self, sources: Iterable
+    ) -> List[Tuple[Union[List[FeedItem], BaseException], CacheValidators]]:
+        """
+        Scrape several sources concurrently over the shared connection pool.
+        
+        At most MAX_CONCURRENT_FETCHES sources are fetched at once (enforced
+        by scrape_source), so network latency overlaps without flooding the
+        connector. The sources themselves are only read.
+        
+        Args:
+            sources: Objects exposing ``url`` and ``type`` attributes, and
+                optionally stored ``etag``/``last_modified`` validators
+            
+        Returns:
+            One (result, validators) pair per source, in order: the scraped
+            items or the exception raised while scraping that source, and the
+            source's cache validators after the request
+        """
+        sources = list(sources)
+        validators = [_validators_of(source) for source in sources]
+        results = await asyncio.gather(
+            *(
+                self.scrape_source(source.url, source.type, source_validators)
+                for source, source_validators in zip(sources, validators)
+            ),
+            return_exceptions=True
+        )
+        return list(zip(results, validators))
+    
+    async def scrape_as_completed(
+        self, sources: Iterable
+    ) -> AsyncIterator[Tuple[Any, Union[List[FeedItem], BaseException], CacheValidators]]:
+        """
+        Scrape several sources concurrently, yielding each as soon as it is done.
+        
+        Unlike scrape_many, a slow source does not hold back the results of
+        faster ones. Fetch concurrency is bounded as in scrape_many, and the
+        sources are likewise only read.
+        
+        Args:
+            sources: Objects exposing ``url`` and ``type`` attributes, and
+                optionally stored ``etag``/``last_modified`` validators
+            
+        Yields:
+            (source, result, validators) in completion order, where result is
+            the scraped items or the exception raised while scraping that
+            source, and validators are its cache validators after the request
+        """
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def scrape_one(source) -> None:
+            validators = _validators_of(source)
+            try:
+                result = await self.scrape_source(source.url, source.type, validators)
+            except Exception as e:
+                result = e
+            finished.put_nowait((source, result, validators))
+        
+        tasks = [asyncio.create_task(scrape_one(source)) for source in sources]
+        try:
+            for _ in tasks:
+                yield await finished.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _scrape_rss(self, url: str, validators: Optional[CacheValidators] = None) -> List[FeedItem]:
         """
         Scrape an RSS/Atom feed.
         
+        When ``validators`` are given, they are sent as
+        If-None-Match/If-Modified-Since and refreshed from the response, so an
+        unchanged feed costs a bodyless 304 instead of a download and parse.
+        
         Args:
             url: RSS feed URL
+            validators: Optional cache validators from the previous fetch
             
         Returns:
-            List of FeedItem objects from the feed
+            List of FeedItem objects from the feed (empty if not modified)
         """
-        async with self.session.get(url) as response:
+        session = await self._get_session()
+        async with session.get(url, headers=self._conditional_headers(validators)) as response:
+            if response.status == 304:
+                logger.debug(f"RSS feed {url} not modified")
+                return []
             if response.status != 200:
-                raise ScraperError(f"HTTP {response.status} error for RSS feed {url}")
+                if response.status in RATE_LIMIT_STATUSES:
+                    self._defer_host(url, response)
+                raise ScraperError(f"HTTP {response.status} error for RSS feed {url}", response.status)
+            
+            # Parse entries while the body streams in and stop reading once
+            # enough have been found
+            parser = etree.XMLPullParser(
+                events=("end",), recover=True, resolve_entities=False, no_network=True
+            )
+            body = bytearray()
+            items = []
+            async for chunk in response.content.iter_chunked(RSS_CHUNK_SIZE):
+                body += chunk
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if etree.QName(element).localname in FEED_ENTRY_TAGS:
+                        items.append(self._feed_item_from_element(element, url))
+                        element.clear()
+                        if len(items) >= config.MAX_ITEMS_PER_UPDATE:
+                            break
+                if len(items) >= config.MAX_ITEMS_PER_UPDATE or len(body) > config.MAX_RESPONSE_BYTES:
+                    break
+            
+            if items:
+                self._remember_validators(validators, response)
+                logger.info(f"Scraped {len(items)} items from RSS feed {url}")
+                return items
+            if len(body) > config.MAX_RESPONSE_BYTES:
+                raise ScraperError(f"RSS feed {url} is larger than {config.MAX_RESPONSE_BYTES} bytes")
+            
+            # Feeds the streaming parse cannot read fall back to feedparser on
+            # the full body; it sniffs the encoding from the raw bytes itself
+            raw = bytes(body)
             
-            content = await response.text()
-            feed = feedparser.parse(content)
+            # Identical bodies (servers without validators, unchanged feeds)
+            # reuse the previous parse; hashing is far cheaper than parsing
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            cached = self._parse_cache.get(url)
+            if cached is not None and cached[0] == digest:
+                logger.debug(f"RSS feed {url} unchanged since last parse")
+                self._remember_validators(validators, response)
+                return list(cached[1])
+            
+            feed = await asyncio.get_running_loop().run_in_executor(
+                self._get_parse_pool(), feedparser.parse, raw
+            )
             
             if feed.bozo and feed.bozo_exception:
                 logger.warning(f"Feed parser warning for {url}: {feed.bozo_exception}")
@@ -196,15 +661,14 @@ class ScraperService:
                 description = entry.get('description', entry.get('summary', ''))
                 content = self._clean_html_content(description)
                 
-                # Parse publication date
-                published_at = ""
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                # Parse publication date (feedparser's struct is already UTC);
+                # raw date strings are parsed by FeedItem
+                published_at = entry.get('published')
+                if entry.get('published_parsed'):
                     try:
-                        published_at = datetime(*entry.published_parsed[:6]).isoformat()
+                        published_at = datetime(*entry.published_parsed[:6])
                     except (ValueError, TypeError):
                         pass
-                elif entry.get('published'):
-                    published_at = entry.published
                 
                 items.append(FeedItem(
                     title=entry.get('title', 'No title'),
@@ -214,8 +678,82 @@ class ScraperService:
                     source_type="rss"
                 ))
             
+            # Only remember the validators once the body parsed successfully
+            self._parse_cache[url] = (digest, items)
+            self._remember_validators(validators, response)
+            
             logger.info(f"Scraped {len(items)} items from RSS feed {url}")
-            return items
+            return list(items)
+    
+    def _feed_item_from_element(self, element: Any, url: str) -> FeedItem:
+        """
+        Build a FeedItem from an RSS <item> or Atom <entry> element.
+        
+        Args:
+            element: Parsed entry element
+            url: Feed URL, used as the link if the entry has none
+            
+        Returns:
+            FeedItem for the entry
+        """
+        fields = {}
+        link = None
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue  # comments and processing instructions
+            name = etree.QName(child).localname
+            if name == "link" and link is None:
+                # Atom links carry the URL in href; RSS links as text
+                if child.get("href") is not None:
+                    if child.get("rel", "alternate") == "alternate":
+                        link = child.get("href")
+                else:
+                    link = (child.text or "").strip() or None
+            elif name not in fields:
+                fields[name] = "".join(child.itertext()).strip()
+        
+        content = next((fields[name] for name in FEED_CONTENT_TAGS if fields.get(name)), "")
+        published_at = next((fields[name] for name in FEED_DATE_TAGS if fields.get(name)), None)
+        
+        return FeedItem(
+            title=fields.get("title") or "No title",
+            url=link or url,
+            content=self._clean_html_content(content),
+            published_at=published_at,  # raw date strings are parsed by FeedItem
+            source_type="rss"
+        )
+    
+    @staticmethod
+    def _conditional_headers(validators: Optional[CacheValidators]) -> Dict[str, str]:
+        """
+        Build If-None-Match/If-Modified-Since headers from stored validators.
+        
+        Args:
+            validators: Cache validators from the previous fetch, or None
+            
+        Returns:
+            Request headers (empty if nothing is stored)
+        """
+        headers = {}
+        if validators is not None:
+            if validators.etag:
+                headers["If-None-Match"] = validators.etag
+            if validators.last_modified:
+                headers["If-Modified-Since"] = validators.last_modified
+        return headers
+    
+    @staticmethod
+    def _remember_validators(validators: Optional[CacheValidators], response: aiohttp.ClientResponse) -> None:
+        """
+        Store the response's cache validators for the next request.
+        
+        Args:
+            validators: Cache validators to update, or None
+            response: Successful feed response
+        """
+        if validators is not None:
+            validators.etag = response.headers.get("ETag")
+            validators.last_modified = response.headers.get("Last-Modified")
     
     async def _scrape_twitter(self, url: str) -> List[FeedItem]:
         """
@@ -236,20 +774,27 @@ class ScraperService:
         logger.info("2. Using alternative services like Nitter (https://nitter.net)")
         logger.info("3. Using RSS feeds from services that convert Twitter to RSS")
         
-        # Placeholder: Try to find alternative RSS feeds
-        username = url.split('/')[-1].replace('@', '')
-        alternative_feeds = [
-            f"https://nitter.net/{username}/rss",
-            f"https://twitrss.me/twitter_user_to_rss/?user={username}",
+        # Placeholder: query the RSS mirrors concurrently and take the first
+        # one that returns items
+        username = url.rstrip('/').split('/')[-1].replace('@', '')
+        tasks = [
+            asyncio.create_task(asyncio.wait_for(
+                self._scrape_rss(mirror.format(username=username)), TWITTER_MIRROR_TIMEOUT
+            ))
+            for mirror in TWITTER_FEED_MIRRORS
         ]
-        
-        for feed_url in alternative_feeds:
-            try:
-                logger.info(f"Trying alternative RSS feed: {feed_url}")
-                return await self._scrape_rss(feed_url)
-            except Exception as e:
-                logger.debug(f"Alternative feed failed: {e}")
-                continue
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    items = await next_done
+                except Exception as e:
+                    logger.debug(f"Alternative feed failed for {url}: {e!r}")
+                    continue
+                if items:
+                    return items
+        finally:
+            for task in tasks:
+                task.cancel()
         
         return []
     
@@ -277,7 +822,7 @@ class ScraperService:
             title="Facebook Scraping Not Available",
             url=url,
             content="Facebook scraping requires official API access. Please set up Facebook Graph API credentials.",
-            published_at=datetime.now().isoformat(),
+            published_at=datetime.utcnow(),
             source_type="facebook"
         )]
     
@@ -305,7 +850,7 @@ class ScraperService:
             title="Instagram Scraping Not Available",
             url=url,
             content="Instagram scraping requires official API access. Please set up Instagram API credentials.",
-            published_at=datetime.now().isoformat(),
+            published_at=datetime.utcnow(),
             source_type="instagram"
         )]
     
@@ -322,20 +867,16 @@ class ScraperService:
             List of FeedItem objects from the channel
         """
         try:
-            # Extract channel ID from URL
-            if "/channel/" in url:
-                channel_id = url.split("/channel/")[1].split("/")[0]
-            elif "/c/" in url or "/user/" in url:
-                # For custom URLs, we'd need to resolve to channel ID
-                # This is a simplified approach
-                logger.warning(f"Custom YouTube URLs require additional resolution: {url}")
-                return []
-            else:
-                logger.error(f"Unable to parse YouTube URL: {url}")
+            # Map the channel ID in the URL to YouTube's RSS feed
+            rss_url = _youtube_rss_url(url)
+            if rss_url is None:
+                if "/c/" in url or "/user/" in url:
+                    # For custom URLs, we'd need to resolve to channel ID
+                    logger.warning(f"Custom YouTube URLs require additional resolution: {url}")
+                else:
+                    logger.error(f"Unable to parse YouTube URL: {url}")
                 return []
             
-            # Use YouTube RSS feed
-            rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
             logger.info(f"Using YouTube RSS feed: {rss_url}")
             
             return await self._scrape_rss(rss_url)
@@ -358,11 +899,7 @@ class ScraperService:
         """
         try:
             # Convert Reddit URL to RSS feed
-            if url.endswith('/'):
-                rss_url = url + ".rss"
-            else:
-                rss_url = url + "/.rss"
-            
+            rss_url = _reddit_rss_url(url)
             logger.info(f"Using Reddit RSS feed: {rss_url}")
             return await self._scrape_rss(rss_url)
             
@@ -370,83 +907,97 @@ class ScraperService:
             logger.error(f"Error scraping Reddit URL {url}: {e}")
             return []
     
-    async def _scrape_website(self, url: str) -> List[FeedItem]:
+    async def _scrape_website(self, url: str, validators: Optional[CacheValidators] = None) -> List[FeedItem]:
         """
         Scrape a generic website by looking for article-like content.
         
+        Like feeds, pages are requested conditionally when ``validators``
+        from an earlier response are given.
+        
         Args:
             url: Website URL to scrape
+            validators: Optional cache validators from the previous fetch
             
         Returns:
-            List of FeedItem objects found on the website
+            List of FeedItem objects found on the website (empty if not modified)
         """
-        async with self.session.get(url) as response:
+        session = await self._get_session()
+        async with session.get(url, headers=self._conditional_headers(validators)) as response:
+            if response.status == 304:
+                logger.debug(f"Website {url} not modified")
+                return []
             if response.status != 200:
-                raise ScraperError(f"HTTP {response.status} error for website {url}")
-            
-            text = await response.text()
-            soup = BeautifulSoup(text, 'lxml')
-            
-            # Try to find article-like elements
-            article_selectors = [
-                'article',
-                '.article',
-                '.post',
-                '.entry',
-                '.content article',
-                '[role="article"]',
-                '.news-item',
-                '.blog-post'
-            ]
+                if response.status in RATE_LIMIT_STATUSES:
+                    self._defer_host(url, response)
+                raise ScraperError(f"HTTP {response.status} error for website {url}", response.status)
             
+            # Parse incrementally and stop downloading once enough article
+            # elements have been seen; most pages never need to be read in full
+            parser = etree.HTMLPullParser(events=("end",), encoding=response.charset)
             articles = []
-            for selector in article_selectors:
-                found = soup.select(selector)
-                if found:
-                    articles.extend(found)
+            page_title = ""
+            received = 0
+            async for chunk in response.content.iter_chunked(WEBSITE_CHUNK_SIZE):
+                # Oversized pages are parsed only up to the size limit
+                received += len(chunk)
+                if received > config.MAX_RESPONSE_BYTES:
+                    break
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if element.tag == "title" and not page_title:
+                        page_title = " ".join("".join(element.itertext()).split())
+                    elif _is_article_element(element):
+                        articles.append(element)
+                if len(articles) >= config.MAX_ITEMS_PER_UPDATE:
                     break
             
-            # Fallback to common content containers
-            if not articles:
-                articles = soup.find_all(['div'], class_=re.compile(r'content|post|article|entry', re.I))
+            self._remember_validators(validators, response)
+            try:
+                doc = parser.close()
+            except etree.XMLSyntaxError:
+                # Empty or unparseable body
+                return []
+        
+        # Fall back to common content containers, then paragraphs; each step
+        # is a single XPath query evaluated in C
+        if not articles:
+            for xpath in WEBSITE_FALLBACK_XPATHS:
+                articles = xpath(doc)
+                if articles:
+                    break
+        
+        items = []
+        page_title = page_title or "Website Update"
+        
+        for i, article in enumerate(articles[:config.MAX_ITEMS_PER_UPDATE]):
+            text_content = " ".join("".join(article.itertext()).split())
             
-            # Final fallback to paragraphs
-            if not articles:
-                articles = soup.find_all('p')
+            # Only include substantial content
+            if len(text_content) < 100:
+                continue
             
-            items = []
-            page_title = soup.title.string.strip() if soup.title else "Website Update"
+            # Try to find a title within the article
+            title_elem = ARTICLE_TITLE_XPATH(article)
+            title = " ".join("".join(title_elem[0].itertext()).split()) if title_elem else f"{page_title} - Item {i+1}"
             
-            for i, article in enumerate(articles[:config.MAX_ITEMS_PER_UPDATE]):
-                text_content = article.get_text(strip=True)
-                
-                # Only include substantial content
-                if len(text_content) < 100:
-                    continue
-                
-                # Try to find a title within the article
-                title_elem = article.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                title = title_elem.get_text(strip=True) if title_elem else f"{page_title} - Item {i+1}"
-                
-                # Try to find a link
-                link_elem = article.find('a', href=True)
-                item_url = urljoin(url, link_elem['href']) if link_elem else url
-                
-                # Clean and truncate content
-                content = self._clean_html_content(text_content)
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                
-                items.append(FeedItem(
-                    title=title,
-                    url=item_url,
-                    content=content,
-                    published_at="",
-                    source_type="website"
-                ))
+            # Try to find a link
+            link_elem = ARTICLE_LINK_XPATH(article)
+            item_url = urljoin(url, link_elem[0]) if link_elem else url
+            
+            # Truncate content
+            content = text_content
+            if len(content) > 500:
+                content = content[:500] + "..."
             
-            logger.info(f"Scraped {len(items)} items from website {url}")
-            return items
+            items.append(FeedItem(
+                title=title,
+                url=item_url,
+                content=content,
+                source_type="website"
+            ))
+        
+        logger.info(f"Scraped {len(items)} items from website {url}")
+        return items
     
     def _clean_html_content(self, content: str) -> str:
         """
@@ -461,24 +1012,19 @@ class ScraperService:
         if not content:
             return ""
         
-        # Parse HTML and extract text
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text and normalize whitespace
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Strip markup with a regex pass instead of building a parse tree;
+        # plain-text descriptions skip straight to whitespace normalization
+        if "<" in content:
+            content = HTML_STRIP_RE.sub(" ", content)
+        if "&" in content:
+            content = html.unescape(content)
         
-        return text
+        # str.split() collapses whitespace runs and trims in one C-level pass
+        return " ".join(content.split())
     
     async def close(self) -> None:
         """
-        Clean up resources by closing the HTTP session.
+        Clean up resources by closing the HTTP session and the parse pool.
         
         This method should be called when the scraper service is no longer needed
         to ensure proper cleanup of network connections.
@@ -486,6 +1032,9 @@ class ScraperService:
         if self.session and not self.session.closed:
             await self.session.close()
             logger.info("ScraperService session closed")
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
     
     async def __aenter__(self):
         """Async context manager entry."""
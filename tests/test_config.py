@@ -73,7 +73,7 @@ class TestConfig:
             'ADMIN_IDS': '123456789,  987654321 , 555666777'
         }):
             config = Config()
-            expected_ids = [123456789, 987654321, 555666777]
+            expected_ids = frozenset({123456789, 987654321, 555666777})
             assert config.ADMIN_IDS == expected_ids
     
     def test_admin_ids_parsing_invalid(self):
@@ -83,7 +83,7 @@ class TestConfig:
         }):
             config = Config()
             # Should only include valid numeric IDs
-            expected_ids = [123456789, 987654321]
+            expected_ids = frozenset({123456789, 987654321})
             assert config.ADMIN_IDS == expected_ids
     
     def test_default_values(self):
@@ -9,10 +9,10 @@ import pytest
 import tempfile
 import os
 from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, event
 from sqlalchemy.orm import sessionmaker
 
-from models.database import Base, User, Source, Subscription, init_db
+from models.database import Base, User, Source, Subscription, init_db, upsert_insert, _configure_sqlite_connection
 
 
 class TestDatabase:
@@ -27,6 +27,7 @@ class TestDatabase:
         
         # Create engine and session
         engine = create_engine(f'sqlite:///{path}')
+        event.listen(engine, "connect", _configure_sqlite_connection)
         Base.metadata.create_all(engine)
         SessionLocal = sessionmaker(bind=engine)
         
@@ -81,6 +82,25 @@ class TestDatabase:
         
         session.close()
     
+    def test_user_upsert(self, temp_db):
+        """Test that the upsert insert refreshes existing users in place."""
+        session = temp_db()
+        
+        for username in ("first", "second"):
+            stmt = upsert_insert(User).values(id=123456789, username=username)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.id],
+                set_={"username": stmt.excluded.username}
+            )
+            session.execute(stmt)
+            session.commit()
+        
+        users = session.query(User).all()
+        assert len(users) == 1
+        assert users[0].username == "second"
+        
+        session.close()
+    
     def test_source_creation(self, temp_db):
         """Test creating and retrieving sources."""
         session = temp_db()
@@ -154,6 +174,25 @@ class TestDatabase:
         
         session.close()
     
+    def test_source_deletion_cascades(self, temp_db):
+        """Test that deleting a source removes its subscriptions."""
+        session = temp_db()
+        
+        user = User(id=123456789, username="testuser")
+        source = Source(url="https://example.com/feed.rss", type="rss", added_by=123456789)
+        session.add_all([user, source])
+        session.commit()
+        
+        session.add(Subscription(user_id=user.id, source_id=source.id))
+        session.commit()
+        
+        session.execute(delete(Source).where(Source.id == source.id))
+        session.commit()
+        
+        assert session.query(Subscription).count() == 0
+        
+        session.close()
+    
     def test_unique_constraints(self, temp_db):
         """Test that unique constraints work properly."""
         session = temp_db()
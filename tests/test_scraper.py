@@ -6,134 +6,99 @@ including RSS feeds, website scraping, and source detection.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from services.scraper import ScraperService, ScraperError
-from models.schemas import FeedItem
+from models.schemas import CacheValidators, FeedItem
+
+
+async def _chunks(data: bytes, size: int = 64):
+    """Yield a response body in small chunks, like aiohttp's iter_chunked."""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
 
 
 class TestScraperService:
     """Test the scraper service functionality."""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def scraper(self):
         """Create a scraper service instance for testing."""
         scraper = ScraperService()
         yield scraper
         await scraper.close()
     
-    def test_source_type_detection_twitter(self, scraper):
-        """Test Twitter URL detection."""
-        urls = [
-            "https://twitter.com/username",
-            "https://x.com/username",
-            "https://www.twitter.com/username/",
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "twitter"
-    
-    def test_source_type_detection_facebook(self, scraper):
-        """Test Facebook URL detection."""
-        urls = [
-            "https://facebook.com/page",
-            "https://www.facebook.com/page/",
-            "https://fb.com/page"
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "facebook"
-    
-    def test_source_type_detection_instagram(self, scraper):
-        """Test Instagram URL detection."""
-        urls = [
-            "https://instagram.com/username",
-            "https://www.instagram.com/username/",
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "instagram"
-    
-    def test_source_type_detection_youtube(self, scraper):
-        """Test YouTube URL detection."""
-        urls = [
-            "https://youtube.com/channel/UCxxx",
-            "https://www.youtube.com/channel/UCxxx",
-            "https://youtu.be/video_id"
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "youtube"
-    
-    def test_source_type_detection_reddit(self, scraper):
-        """Test Reddit URL detection."""
-        urls = [
-            "https://reddit.com/r/technology",
-            "https://www.reddit.com/r/python/",
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "reddit"
+    @pytest.mark.parametrize("url, expected", [
+        ("https://twitter.com/username", "twitter"),
+        ("https://x.com/username", "twitter"),
+        ("https://www.twitter.com/username/", "twitter"),
+        ("https://facebook.com/page", "facebook"),
+        ("https://www.facebook.com/page/", "facebook"),
+        ("https://fb.com/page", "facebook"),
+        ("https://instagram.com/username", "instagram"),
+        ("https://www.instagram.com/username/", "instagram"),
+        ("https://youtube.com/channel/UCxxx", "youtube"),
+        ("https://www.youtube.com/channel/UCxxx", "youtube"),
+        ("https://youtu.be/video_id", "youtube"),
+        ("https://reddit.com/r/technology", "reddit"),
+        ("https://www.reddit.com/r/python/", "reddit"),
+        ("https://example.com/feed.rss", "rss"),
+        ("https://example.com/feed.xml", "rss"),
+        ("https://example.com/rss/", "rss"),
+        ("https://example.com/atom.xml", "rss"),
+        ("https://example.com/feeds/all.atom", "rss"),
+    ])
+    def test_source_type_detection(self, scraper, url, expected):
+        """Test platform and feed URL detection."""
+        assert scraper.classify_url(url) == expected
     
-    def test_source_type_detection_rss(self, scraper):
-        """Test RSS URL detection by pattern."""
-        urls = [
-            "https://example.com/feed.rss",
-            "https://example.com/feed.xml",
-            "https://example.com/rss/",
-            "https://example.com/atom.xml",
-            "https://example.com/feeds/all.atom"
-        ]
-        
-        for url in urls:
-            result = asyncio.run(scraper.detect_source_type(url))
-            assert result == "rss"
-    
-    def test_invalid_url_detection(self, scraper):
+    @pytest.mark.parametrize("url", [
+        "not-a-url",
+        "ftp://example.com",
+        "",
+        "javascript:alert('xss')"
+    ])
+    async def test_invalid_url_detection(self, scraper, url):
         """Test detection with invalid URLs."""
-        invalid_urls = [
-            "not-a-url",
-            "ftp://example.com",
-            "",
-            "javascript:alert('xss')"
-        ]
-        
-        for url in invalid_urls:
-            with pytest.raises(ScraperError):
-                asyncio.run(scraper.detect_source_type(url))
+        with pytest.raises(ScraperError):
+            await scraper.detect_source_type(url)
     
-    @patch('services.scraper.feedparser.parse')
-    async def test_rss_scraping_success(self, mock_feedparser, scraper):
+    @pytest.mark.parametrize("value", [
+        "2024-01-01T12:00:00Z",
+        "2024-01-01T14:00:00+02:00",
+        "Mon, 01 Jan 2024 12:00:00 GMT",
+    ])
+    def test_feed_item_date_parsing(self, value):
+        """Test that Atom and RSS dates are normalized to naive UTC."""
+        item = FeedItem(title="T", url="https://example.com", content="C", published_at=value, source_type="rss")
+        assert item.published_at == datetime(2024, 1, 1, 12, 0)
+    
+    async def test_rss_scraping_success(self, scraper):
         """Test successful RSS feed scraping."""
-        # Mock feedparser response
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            {
-                'title': 'Test Article 1',
-                'link': 'https://example.com/article1',
-                'description': 'This is test article 1',
-                'published': '2024-01-01T12:00:00Z'
-            },
-            {
-                'title': 'Test Article 2', 
-                'link': 'https://example.com/article2',
-                'description': 'This is test article 2',
-                'published': '2024-01-02T12:00:00Z'
-            }
-        ]
-        mock_feedparser.return_value = mock_feed
+        rss_content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0"><channel><title>Test Feed</title>
+            <item>
+                <title>Test Article 1</title>
+                <link>https://example.com/article1</link>
+                <description>&lt;p&gt;This is test article 1&lt;/p&gt;</description>
+                <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
+            </item>
+            <item>
+                <title>Test Article 2</title>
+                <link>https://example.com/article2</link>
+                <description>This is test article 2</description>
+                <pubDate>Tue, 02 Jan 2024 12:00:00 GMT</pubDate>
+            </item>
+        </channel></rss>"""
         
         # Mock aiohttp response
-        with patch.object(scraper.session, 'get') as mock_get:
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.text = AsyncMock(return_value="<rss><channel></channel></rss>")
+            mock_response.content.iter_chunked = MagicMock(return_value=_chunks(rss_content))
             mock_get.return_value.__aenter__.return_value = mock_response
             
             result = await scraper._scrape_rss("https://example.com/feed.rss")
@@ -141,12 +106,38 @@ class TestScraperService:
             assert len(result) == 2
             assert result[0].title == "Test Article 1"
             assert result[0].url == "https://example.com/article1"
+            assert result[0].content == "This is test article 1"
+            assert result[0].published_at == datetime(2024, 1, 1, 12, 0)
             assert result[0].source_type == "rss"
             assert result[1].title == "Test Article 2"
     
+    async def test_atom_scraping_stops_after_item_limit(self, scraper):
+        """Test that Atom entries are parsed and reading stops at the item limit."""
+        entries = b"".join(
+            b'<entry><title>Entry %d</title><link rel="alternate" href="https://example.com/%d"/>'
+            b'<summary>Summary %d</summary><updated>2024-01-01T12:00:00Z</updated></entry>' % (i, i, i)
+            for i in range(50)
+        )
+        atom_content = b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>' + entries + b'</feed>'
+        
+        session = await scraper._get_session()
+        with patch('services.scraper.config.MAX_ITEMS_PER_UPDATE', 3), \
+             patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.content.iter_chunked = MagicMock(return_value=_chunks(atom_content))
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            result = await scraper._scrape_rss("https://example.com/atom.xml")
+            
+            assert [item.url for item in result] == [f"https://example.com/{i}" for i in range(3)]
+            assert result[2].content == "Summary 2"
+            mock_response.read.assert_not_called()
+    
     async def test_rss_scraping_http_error(self, scraper):
         """Test RSS scraping with HTTP error."""
-        with patch.object(scraper.session, 'get') as mock_get:
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
             mock_response = AsyncMock()
             mock_response.status = 404
             mock_get.return_value.__aenter__.return_value = mock_response
@@ -154,6 +145,80 @@ class TestScraperService:
             with pytest.raises(ScraperError, match="HTTP 404"):
                 await scraper._scrape_rss("https://example.com/feed.rss")
     
+    async def test_rss_rate_limit_defers_host(self, scraper):
+        """Test that a 429 with Retry-After stops further requests to the host."""
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 429
+            mock_response.headers = {'Retry-After': '120'}
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            with pytest.raises(ScraperError, match="HTTP 429"):
+                await scraper._scrape_rss("https://example.com/feed.rss")
+            
+            with pytest.raises(ScraperError, match="rate limited"):
+                await scraper.scrape_source("https://example.com/other.rss", "rss")
+            
+            assert mock_get.call_count == 1
+    
+    async def test_rss_content_detection_is_cached(self, scraper):
+        """Test that sniffing a URL's content is not repeated."""
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.headers = {'content-type': 'application/rss+xml'}
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            first = await scraper.detect_source_type("https://example.com/news")
+            second = await scraper.detect_source_type("https://example.com/news")
+            
+            assert first == second == "rss"
+            assert mock_get.call_count == 1
+    
+    @patch('services.scraper.feedparser.parse')
+    async def test_rss_identical_body_reuses_parse(self, mock_feedparser, scraper):
+        """Test that an unchanged feed body is not parsed twice."""
+        mock_feed = MagicMock()
+        mock_feed.bozo = False
+        mock_feed.entries = [{'title': 'Cached', 'link': 'https://example.com/a', 'description': 'Body'}]
+        mock_feedparser.return_value = mock_feed
+        
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.content.iter_chunked = MagicMock(
+                side_effect=lambda size: _chunks(b"<rss><channel></channel></rss>")
+            )
+            mock_response.read = AsyncMock(return_value=b"")
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            first = await scraper._scrape_rss("https://example.com/feed.rss")
+            second = await scraper._scrape_rss("https://example.com/feed.rss")
+            
+            assert mock_feedparser.call_count == 1
+            assert [item.title for item in second] == [item.title for item in first] == ["Cached"]
+    
+    async def test_rss_conditional_get_not_modified(self, scraper):
+        """Test that stored validators are sent and a 304 yields no items."""
+        validators = CacheValidators(etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 304
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            result = await scraper._scrape_rss("https://example.com/feed.rss", validators)
+            
+            assert result == []
+            headers = mock_get.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"abc"'
+            assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+            mock_response.read.assert_not_called()
+    
     async def test_website_scraping_success(self, scraper):
         """Test successful website scraping."""
         html_content = """
@@ -175,10 +240,12 @@ class TestScraperService:
         </html>
         """
         
-        with patch.object(scraper.session, 'get') as mock_get:
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.text = AsyncMock(return_value=html_content)
+            mock_response.charset = "utf-8"
+            mock_response.content.iter_chunked = MagicMock(return_value=_chunks(html_content.encode()))
             mock_get.return_value.__aenter__.return_value = mock_response
             
             result = await scraper._scrape_website("https://example.com")
@@ -201,10 +268,12 @@ class TestScraperService:
         </html>
         """
         
-        with patch.object(scraper.session, 'get') as mock_get:
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.text = AsyncMock(return_value=html_content)
+            mock_response.charset = "utf-8"
+            mock_response.content.iter_chunked = MagicMock(return_value=_chunks(html_content.encode()))
             mock_get.return_value.__aenter__.return_value = mock_response
             
             result = await scraper._scrape_website("https://example.com")
@@ -212,6 +281,24 @@ class TestScraperService:
             # Should return empty list if no substantial content found
             assert len(result) == 0
     
+    async def test_website_conditional_get(self, scraper):
+        """Test that stored validators are sent and an unchanged page is skipped."""
+        validators = CacheValidators(etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+        
+        session = await scraper._get_session()
+        with patch.object(session, 'get') as mock_get:
+            mock_response = AsyncMock()
+            mock_response.status = 304
+            mock_get.return_value.__aenter__.return_value = mock_response
+            
+            result = await scraper._scrape_website("https://example.com", validators)
+            
+            assert result == []
+            headers = mock_get.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"abc"'
+            assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+            mock_response.content.iter_chunked.assert_not_called()
+    
     async def test_html_content_cleaning(self, scraper):
         """Test HTML content cleaning functionality."""
         dirty_html = """
@@ -235,7 +322,8 @@ class TestScraperService:
     async def test_scraper_retry_logic(self, scraper):
         """Test retry logic on failures."""
         with patch('services.scraper.config.MAX_RETRIES', 2), \
-             patch('services.scraper.config.RETRY_DELAY', 0.1):
+             patch('services.scraper.config.RETRY_DELAY', 0.1), \
+             patch('services.scraper.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
             
             with patch.object(scraper, '_scrape_rss') as mock_scrape:
                 # First two calls fail, third succeeds
@@ -250,6 +338,26 @@ class TestScraperService:
                 assert len(result) == 1
                 assert result[0].title == "Success"
                 assert mock_scrape.call_count == 3
+                
+                # Exponential delays, each jittered by +/- 50%
+                delays = [call.args[0] for call in mock_sleep.await_args_list]
+                assert len(delays) == 2
+                assert 0.05 <= delays[0] <= 0.15
+                assert 0.1 <= delays[1] <= 0.3
+    
+    async def test_scraper_client_error_not_retried(self, scraper):
+        """Test that permanent HTTP client errors fail without retrying."""
+        with patch('services.scraper.config.MAX_RETRIES', 2), \
+             patch('services.scraper.config.RETRY_DELAY', 0.1):
+            
+            with patch.object(scraper, '_scrape_rss') as mock_scrape:
+                mock_scrape.side_effect = ScraperError("HTTP 404 error for RSS feed", 404)
+                
+                with pytest.raises(ScraperError, match="HTTP 404") as exc_info:
+                    await scraper.scrape_source("https://example.com/feed.rss", "rss")
+                
+                assert exc_info.value.status == 404
+                assert mock_scrape.call_count == 1
     
     async def test_scraper_max_retries_exceeded(self, scraper):
         """Test behavior when max retries are exceeded."""
@@ -264,6 +372,58 @@ class TestScraperService:
                 
                 assert mock_scrape.call_count == 2  # Initial attempt + 1 retry
     
+    async def test_retry_backoff_releases_fetch_slot(self):
+        """Test that a source waiting to retry does not hold a fetch slot."""
+        with patch('services.scraper.config.MAX_CONCURRENT_FETCHES', 1), \
+             patch('services.scraper.config.RETRY_DELAY', 0.5):
+            scraper = ScraperService()
+        
+        async def fake_rss(url, validators=None):
+            if "failing" in url:
+                raise ScraperError("Temporary error")
+            return [FeedItem(title=url, url=url, content="Test", source_type="rss")]
+        
+        try:
+            with patch('services.scraper.config.RETRY_DELAY', 0.5), \
+                 patch.object(scraper, '_scrape_rss', side_effect=fake_rss):
+                failing = asyncio.create_task(scraper.scrape_source("https://failing.example.com/feed.rss", "rss"))
+                await asyncio.sleep(0.05)  # first attempt failed, now backing off
+                
+                result = await asyncio.wait_for(
+                    scraper.scrape_source("https://ok.example.com/feed.rss", "rss"), timeout=0.2
+                )
+                
+                assert result[0].title == "https://ok.example.com/feed.rss"
+                assert not failing.done()
+                failing.cancel()
+        finally:
+            await scraper.close()
+    
+    async def test_scrape_as_completed_yields_fast_sources_first(self, scraper):
+        """Test that a slow source does not hold back faster ones."""
+        slow = MagicMock(url="https://slow.example.com/feed.rss", type="rss", etag=None, last_modified=None)
+        fast = MagicMock(url="https://fast.example.com/feed.rss", type="rss", etag='"old"', last_modified=None)
+        broken = MagicMock(url="https://broken.example.com/feed.rss", type="rss", etag=None, last_modified=None)
+        
+        async def fake_scrape(url, source_type, validators=None):
+            if url == broken.url:
+                raise ScraperError("Broken feed")
+            await asyncio.sleep(0.2 if url == slow.url else 0)
+            validators.etag = '"new"'
+            return [FeedItem(title=url, url=url, content="Test", source_type="rss")]
+        
+        with patch.object(scraper, 'scrape_source', side_effect=fake_scrape):
+            results = [entry async for entry in scraper.scrape_as_completed([slow, fast, broken])]
+        
+        by_source = {id(source): (result, validators) for source, result, validators in results}
+        assert results[-1][0] is slow
+        assert by_source[id(slow)][0][0].title == slow.url
+        assert isinstance(by_source[id(broken)][0], ScraperError)
+        
+        # Refreshed validators are returned; the sources are left untouched
+        assert by_source[id(fast)][1].etag == '"new"'
+        assert fast.etag == '"old"'
+    
     async def test_facebook_placeholder(self, scraper):
         """Test Facebook scraping placeholder."""
         result = await scraper._scrape_facebook("https://facebook.com/page")
@@ -5,16 +5,43 @@ This module provides centralized logging configuration for the entire applicatio
 with proper formatting and file/console output handling.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Dict
+
+# Background listeners that perform the actual console/file writes, by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+# The log file is rotated at midnight; this many days are kept
+LOG_FILE_BACKUP_COUNT = 14
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# The format above uses no process, thread or multiprocessing fields, so
+# don't collect them for every record. These switches are process-wide:
+# they apply to every logger, including those of third-party libraries, and
+# any handler that prints %(process)d or %(thread)d would show None.
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+
+# Shared by every handler this module creates
+_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
 
 def setup_logger(name: str = "TelegramNewsFeedBot", level: str = "INFO") -> logging.Logger:
     """
     Set up and configure the application logger.
     
+    Records are handed to a QueueHandler and written by a QueueListener
+    thread, so logging from coroutines never blocks the event loop on I/O.
+    Calling this again for a configured logger only updates its level.
+    
     Args:
         name: Name of the logger
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -22,37 +49,53 @@ def setup_logger(name: str = "TelegramNewsFeedBot", level: str = "INFO") -> logg
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-    
-    # Configure logging format
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-    )
-    
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
+    # Handlers and listener are already in place
+    if name in _listeners:
+        return logger
+    
+    # Create logs directory if it doesn't exist
+    logs_dir = Path("logs")
+    logs_dir.mkdir(exist_ok=True)
+    
     # Remove existing handlers to avoid duplicates
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
     
-    # File handler
-    log_file = logs_dir / f"{name.lower()}_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # File handler, opened on the first record and rotated daily
+    log_file = logs_dir / f"{name.lower()}.log"
+    file_handler = TimedRotatingFileHandler(
+        log_file, when='midnight', backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8', delay=True
+    )
+    file_handler.setFormatter(_FORMATTER)
+    
+    # Queue handler on the logger; the listener thread does the writing
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
 
+def _stop_listeners() -> None:
+    """Flush and stop all queue listeners at interpreter exit."""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+
+
 # Global logger instance
 logger = setup_logger()
 
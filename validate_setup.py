@@ -6,17 +6,49 @@ This script validates the bot configuration and dependencies
 to ensure everything is properly set up before running the bot.
 """
 
+import importlib.util
+import io
 import sys
 import os
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Tuple
+
+# Checks that mostly wait on disk or network I/O. They run in background
+# threads while the other checks execute, and their output is printed
+# afterwards in the usual order.
+BACKGROUND_CHECKS = ("Database", "Redis Connectivity")
+
+# Output buffer of the current thread, if it is capturing
+_capture = threading.local()
+
+
+class _ThreadBufferedStream:
+    """Stream wrapper that sends writes to the current thread's capture buffer, if any."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def _target(self):
+        return getattr(_capture, "buffer", None) or self._stream
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
 
 
 def check_python_version():
-    """Check if Python version is 3.8 or higher."""
+    """Check if Python version is 3.10 or higher."""
     print("🐍 Checking Python version...")
-    if sys.version_info < (3, 8):
-        print(f"❌ Python 3.8+ required, found {sys.version}")
+    if sys.version_info < (3, 10):
+        print(f"❌ Python 3.10+ required, found {sys.version}")
         return False
     print(f"✅ Python {sys.version.split()[0]} is supported")
     return True
@@ -32,7 +64,7 @@ def check_dependencies():
         'sqlalchemy',
         'pydantic',
         'python-dotenv',
-        'beautifulsoup4',
+        'lxml',
         'feedparser',
         'redis'
     ]
@@ -45,10 +77,10 @@ def check_dependencies():
             import_name = module
             if module == 'python-dotenv':
                 import_name = 'dotenv'
-            elif module == 'beautifulsoup4':
-                import_name = 'bs4'
             
-            __import__(import_name)
+            # Only locate the module; importing it would run its package code
+            if importlib.util.find_spec(import_name) is None:
+                raise ImportError(import_name)
             print(f"✅ {module}")
         except ImportError:
             print(f"❌ {module} - Not installed")
@@ -247,6 +279,27 @@ def check_file_structure():
     return True
 
 
+def run_check(name, check_func):
+    """Run a single check, reporting failures and crashes."""
+    try:
+        if check_func():
+            return True
+        print(f"\n❌ {name} check failed")
+    except Exception as e:
+        print(f"\n💥 {name} check crashed: {e}")
+        traceback.print_exc()
+    return False
+
+
+def run_check_captured(name, check_func) -> Tuple[bool, str]:
+    """Run a check in a worker thread, returning its result and its output."""
+    _capture.buffer = io.StringIO()
+    try:
+        return run_check(name, check_func), _capture.buffer.getvalue()
+    finally:
+        _capture.buffer = None
+
+
 def main():
     """Run all validation checks."""
     print("🚀 Telegram News Feed Bot - Setup Validation")
@@ -265,15 +318,26 @@ def main():
     passed = 0
     total = len(checks)
     
-    for name, check_func in checks:
-        try:
-            if check_func():
-                passed += 1
-            else:
-                print(f"\n❌ {name} check failed")
-        except Exception as e:
-            print(f"\n💥 {name} check crashed: {e}")
-            traceback.print_exc()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _ThreadBufferedStream(stdout), _ThreadBufferedStream(stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(BACKGROUND_CHECKS)) as executor:
+            background = {
+                name: executor.submit(run_check_captured, name, check_func)
+                for name, check_func in checks
+                if name in BACKGROUND_CHECKS
+            }
+            
+            for name, check_func in checks:
+                if name in background:
+                    ok, output = background[name].result()
+                    print(output, end="")
+                else:
+                    ok = run_check(name, check_func)
+                if ok:
+                    passed += 1
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
     
     print("\n" + "=" * 50)
     print(f"📊 Validation Results: {passed}/{total} checks passed")